@@ -41,11 +41,11 @@ ensure_packages(["geopandas", "matplotlib", "mapclassify", "requests", "shapely"
 import geopandas as gpd
 import pandas as pd
 import requests
-from shapely.geometry import box
 
 from map_builder import config as cfg
 from map_builder.geo.topology import build_topology
 from map_builder.geo.utils import (
+    clip_to_bbox,
     clip_to_europe_bounds,
     pick_column,
     smart_island_cull,
@@ -169,10 +169,9 @@ def despeckle_hybrid(
 def clip_to_land_bounds(gdf: gpd.GeoDataFrame, land: gpd.GeoDataFrame, label: str) -> gpd.GeoDataFrame:
     print(f"Reprojecting and clipping {label}...")
     gdf = gdf.to_crs("EPSG:4326")
-    minx, miny, maxx, maxy = land.total_bounds
-    bbox_geom = box(minx, miny, maxx, maxy)
+    bounds = land.total_bounds
     try:
-        clipped = gpd.clip(gdf, bbox_geom)
+        clipped = clip_to_bbox(gdf, bounds)
     except Exception as exc:
         print(f"Clip failed for {label}, attempting to fix geometries...")
         try:
@@ -180,7 +179,7 @@ def clip_to_land_bounds(gdf: gpd.GeoDataFrame, land: gpd.GeoDataFrame, label: st
                 gdf = gdf.set_geometry(gdf.geometry.make_valid())
             else:
                 gdf = gdf.set_geometry(gdf.geometry.buffer(0))
-            clipped = gpd.clip(gdf, bbox_geom)
+            clipped = clip_to_bbox(gdf, bounds)
         except Exception as fix_exc:
             print(f"Failed to clip {label}: {fix_exc}")
             raise SystemExit(1) from fix_exc
@@ -194,10 +193,8 @@ def clip_to_land_bounds(gdf: gpd.GeoDataFrame, land: gpd.GeoDataFrame, label: st
 def clip_to_bounds(gdf: gpd.GeoDataFrame, bounds: Iterable[float], label: str) -> gpd.GeoDataFrame:
     print(f"Reprojecting and clipping {label} to hybrid bounds...")
     gdf = gdf.to_crs("EPSG:4326")
-    minx, miny, maxx, maxy = bounds
-    bbox_geom = box(minx, miny, maxx, maxy)
     try:
-        clipped = gpd.clip(gdf, bbox_geom)
+        clipped = clip_to_bbox(gdf, bounds)
     except Exception as exc:
         print(f"Clip failed for {label}, attempting to fix geometries...")
         try:
@@ -205,7 +202,7 @@ def clip_to_bounds(gdf: gpd.GeoDataFrame, bounds: Iterable[float], label: str) -
                 gdf = gdf.set_geometry(gdf.geometry.make_valid())
             else:
                 gdf = gdf.set_geometry(gdf.geometry.buffer(0))
-            clipped = gpd.clip(gdf, bbox_geom)
+            clipped = clip_to_bbox(gdf, bounds)
         except Exception as fix_exc:
             print(f"Failed to clip {label}: {fix_exc}")
             raise SystemExit(1) from fix_exc
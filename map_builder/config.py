@@ -1,4 +1,5 @@
 # Centralized configuration for map data pipeline.
+import os
 
 # Data source URLs
 URL = (
@@ -111,6 +112,10 @@ SIMPLIFY_RU_UA = 0.025
 SIMPLIFY_INDIA = 0.015
 URAL_LONGITUDE = 60.0
 
+# Preview rendering (8x8in @ 200dpi, so sub-pixel detail is discarded anyway)
+PREVIEW_ENABLED = os.environ.get("MAPCREATOR_PREVIEW", "1") != "0"
+PREVIEW_SIMPLIFY = 0.05
+
 VIP_POINTS = [
     ("Malta", (14.3754, 35.9375)),
     ("Isle of Wight", (-1.3047, 50.6938)),
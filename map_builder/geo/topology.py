@@ -5,6 +5,7 @@ import json
 import math
 
 import geopandas as gpd
+import shapely
 import topojson as tp
 
 from map_builder.geo.utils import round_geometries
@@ -51,11 +52,9 @@ def build_topology(
     def scrub_geometry(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         if gdf.empty:
             return gdf
-        gdf = gdf[gdf.geometry.notna()]
-        gdf = gdf[~gdf.geometry.is_empty]
-        if hasattr(gdf.geometry, "is_valid"):
-            gdf = gdf[gdf.geometry.is_valid]
-        return gdf
+        geoms = gdf.geometry.to_numpy()
+        mask = ~shapely.is_missing(geoms) & ~shapely.is_empty(geoms) & shapely.is_valid(geoms)
+        return gdf.loc[mask]
 
     candidates = [("political", political)]
     if special_zones is not None:
@@ -74,9 +73,10 @@ def build_topology(
     layer_gdfs: list[gpd.GeoDataFrame] = []
     for name, gdf in candidates:
         gdf = gdf.to_crs("EPSG:4326")
-        gdf = prune_columns(gdf, name)
         gdf = scrub_geometry(gdf)
-        gdf = round_geometries(gdf)
+        # prune_columns returns a fresh frame, so rounding can happen in place.
+        gdf = prune_columns(gdf, name)
+        gdf = round_geometries(gdf, inplace=True)
         if not has_valid_bounds(gdf):
             if name == "political":
                 print("Political layer is empty or invalid; cannot build topology.")
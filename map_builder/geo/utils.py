@@ -1,20 +1,58 @@
 """Shared geometry utilities for the map pipeline."""
 from __future__ import annotations
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
 
 import geopandas as gpd
+import numpy as np
+import shapely
+from pyproj import CRS, Transformer
 from shapely.geometry import Point, box
-from shapely.ops import transform
 
 from map_builder import config as cfg
 
+PARALLEL_TRANSFORM_MIN_POINTS = 200_000
+
+@functools.lru_cache(maxsize=32)
+def _transformer(src_crs: CRS, dst_crs: CRS) -> Transformer:
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+def reproject_geometries(geoms: np.ndarray, src_crs, epsg: int) -> np.ndarray:
+    transformer = _transformer(CRS.from_user_input(src_crs), CRS.from_epsg(epsg))
+
+    def _transform_block(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(*coords.T))
+
+    def _apply(coords: np.ndarray) -> np.ndarray:
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(coords) < PARALLEL_TRANSFORM_MIN_POINTS:
+            return _transform_block(coords)
+        # PROJ releases the GIL, so row slices of the flat coordinate
+        # array can be transformed concurrently and stacked back in order.
+        blocks = np.array_split(coords, workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return np.vstack(list(pool.map(_transform_block, blocks)))
+
+    include_z = bool(shapely.has_z(geoms).any())
+    return shapely.transform(geoms, _apply, include_z=include_z)
+
+
+def reproject(gdf: gpd.GeoDataFrame, epsg: int) -> gpd.GeoDataFrame:
+    if gdf.crs is not None and gdf.crs.to_epsg() == epsg:
+        return gdf
+    geoms = reproject_geometries(gdf.geometry.to_numpy(), gdf.crs, epsg)
+    return gdf.set_geometry(gpd.GeoSeries(geoms, index=gdf.index, crs=f"EPSG:{epsg}"))
+
 
 def ensure_crs(gdf: gpd.GeoDataFrame, epsg: int = 4326) -> gpd.GeoDataFrame:
     if gdf.crs is None:
         gdf = gdf.set_crs(f"EPSG:{epsg}", allow_override=True)
     elif gdf.crs.to_epsg() != epsg:
-        gdf = gdf.to_crs(f"EPSG:{epsg}")
+        gdf = reproject(gdf, epsg)
     return gdf
 
 
@@ -25,30 +63,98 @@ def pick_column(df: gpd.GeoDataFrame, candidates: Iterable[str]) -> str | None:
     return None
 
 
-def round_geometries(gdf: gpd.GeoDataFrame, precision: int = 4) -> gpd.GeoDataFrame:
+def round_coordinates(geoms: np.ndarray, precision: int = 4) -> np.ndarray:
+    include_z = bool(shapely.has_z(geoms).any())
+    return shapely.transform(
+        geoms, lambda coords: coords.round(precision), include_z=include_z
+    )
+
+
+def round_geometries(
+    gdf: gpd.GeoDataFrame, precision: int = 4, inplace: bool = False
+) -> gpd.GeoDataFrame:
+    if gdf.empty:
+        return gdf
+
+    rounded = gpd.GeoSeries(
+        round_coordinates(gdf.geometry.to_numpy(), precision),
+        index=gdf.index,
+        crs=gdf.crs,
+    )
+    if inplace:
+        gdf.set_geometry(rounded, inplace=True)
+        return gdf
+    return gdf.set_geometry(rounded)
+
+
+def make_valid_geometries(geoms: np.ndarray) -> np.ndarray:
+    invalid = ~shapely.is_valid(geoms) & ~shapely.is_missing(geoms)
+    if not invalid.any():
+        return geoms
+    repaired = geoms.copy()
+    repaired[invalid] = shapely.make_valid(geoms[invalid])
+    return repaired
+
+
+def clean_and_simplify(gdf: gpd.GeoDataFrame, tolerance: float) -> gpd.GeoDataFrame:
     if gdf.empty:
         return gdf
+    geoms = make_valid_geometries(gdf.geometry.to_numpy())
+    geoms = shapely.simplify(geoms, tolerance, preserve_topology=True)
+    # preserve_topology keeps rings simple but can still emit invalid output.
+    geoms = make_valid_geometries(geoms)
+    return gdf.set_geometry(gpd.GeoSeries(geoms, index=gdf.index, crs=gdf.crs))
 
-    def _rounder(x, y, z=None):
-        rx = round(x, precision)
-        ry = round(y, precision)
-        if z is None:
-            return (rx, ry)
-        return (rx, ry, round(z, precision))
 
-    gdf = gdf.copy()
-    gdf["geometry"] = gdf.geometry.apply(
-        lambda geom: transform(_rounder, geom) if geom is not None else geom
+def bounds_overlap(a: Iterable[float], b: Iterable[float]) -> bool:
+    aminx, aminy, amaxx, amaxy = a
+    bminx, bminy, bmaxx, bmaxy = b
+    return aminx <= bmaxx and bminx <= amaxx and aminy <= bmaxy and bminy <= amaxy
+
+
+def union_coverage(geoms: np.ndarray):
+    # Coverage union is linear in edge count but only accepts correctly noded,
+    # edge-sharing polygons; anything else goes through the full overlay union.
+    try:
+        merged = shapely.coverage_union_all(geoms)
+        if shapely.is_valid(merged):
+            return merged
+    except shapely.errors.GEOSException:
+        pass
+    return shapely.union_all(geoms)
+
+
+def clip_to_bbox(gdf: gpd.GeoDataFrame, bounds: Iterable[float]) -> gpd.GeoDataFrame:
+    minx, miny, maxx, maxy = bounds
+    candidates = gdf.cx[minx:maxx, miny:maxy]
+    if candidates.empty:
+        return candidates
+
+    geoms = candidates.geometry.to_numpy()
+    geom_bounds = shapely.bounds(geoms)
+    straddling = ~(
+        (geom_bounds[:, 0] >= minx)
+        & (geom_bounds[:, 1] >= miny)
+        & (geom_bounds[:, 2] <= maxx)
+        & (geom_bounds[:, 3] <= maxy)
     )
-    return gdf
+    if not straddling.any():
+        return candidates
+
+    clipped = geoms.copy()
+    clipped[straddling] = shapely.intersection(
+        geoms[straddling], box(minx, miny, maxx, maxy)
+    )
+    candidates = candidates.set_geometry(
+        gpd.GeoSeries(clipped, index=candidates.index, crs=candidates.crs)
+    )
+    return candidates.loc[~shapely.is_empty(clipped)]
 
 
 def clip_to_europe_bounds(gdf: gpd.GeoDataFrame, label: str) -> gpd.GeoDataFrame:
-    minx, miny, maxx, maxy = cfg.MAP_BOUNDS
-    bbox_geom = box(minx, miny, maxx, maxy)
     try:
-        gdf = gdf.to_crs("EPSG:4326")
-        clipped = gpd.clip(gdf, bbox_geom)
+        gdf = ensure_crs(gdf)
+        clipped = clip_to_bbox(gdf, cfg.MAP_BOUNDS)
         if clipped.empty:
             print(f"Map bounds clip produced empty result for {label}; keeping original.")
             return gdf
@@ -60,7 +166,7 @@ def clip_to_europe_bounds(gdf: gpd.GeoDataFrame, label: str) -> gpd.GeoDataFrame
                 gdf = gdf.set_geometry(gdf.geometry.make_valid())
             else:
                 gdf = gdf.set_geometry(gdf.geometry.buffer(0))
-            clipped = gpd.clip(gdf, bbox_geom)
+            clipped = clip_to_bbox(gdf, cfg.MAP_BOUNDS)
         except Exception as fix_exc:
             print(f"Map bounds clip skipped for {label}: {fix_exc}")
             return gdf
@@ -82,15 +188,15 @@ def smart_island_cull(
 
     exploded = exploded.copy()
     try:
-        projected = exploded.to_crs("EPSG:3035")
-        exploded["area_km2"] = projected.geometry.area / 1_000_000.0
+        projected = reproject_geometries(exploded.geometry.to_numpy(), exploded.crs, 3035)
+        exploded["area_km2"] = shapely.area(projected) / 1_000_000.0
     except Exception as exc:
         print(f"Smart cull area calc failed, keeping original: {exc}")
         return gdf
 
     vip_points = [Point(lon, lat) for _, (lon, lat) in cfg.VIP_POINTS]
     try:
-        exploded_ll = exploded.to_crs("EPSG:4326")
+        exploded_ll = ensure_crs(exploded)
         exploded["vip_keep"] = exploded_ll.geometry.apply(
             lambda geom: any(geom.intersects(pt) for pt in vip_points)
             if geom is not None
@@ -37,6 +37,15 @@ def _build_mirror_urls(url: str) -> list[str]:
     return mirrors
 
 
+def _read_vector(path: Path | str) -> gpd.GeoDataFrame:
+    # pyogrio with Arrow hands WKB to shapely in bulk instead of building a
+    # Python dict per feature; fall back to the default reader without it.
+    try:
+        return gpd.read_file(path, engine="pyogrio", use_arrow=True)
+    except ImportError:
+        return gpd.read_file(path)
+
+
 def fetch_ne_zip(url: str, label: str) -> gpd.GeoDataFrame:
     print(f"Downloading Natural Earth {label}...")
     try:
@@ -57,7 +66,7 @@ def fetch_ne_zip(url: str, label: str) -> gpd.GeoDataFrame:
             raise SystemExit(1) from exc
 
         print(f"Reading {label} dataset...")
-        gdf = gpd.read_file(temp_dir)
+        gdf = _read_vector(temp_dir)
 
     if gdf.empty:
         print(f"{label} GeoDataFrame is empty. Check the download.")
@@ -71,13 +80,31 @@ def _cache_path(filename: str) -> Path:
     return cache_dir / filename
 
 
+def _read_cached_geojson(cache_path: Path) -> gpd.GeoDataFrame:
+    # GeoJSON parsing dominates repeat runs; keep a GeoParquet sibling that is
+    # refreshed whenever the GeoJSON is newer.
+    parquet_path = cache_path.with_suffix(".parquet")
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= cache_path.stat().st_mtime:
+        try:
+            return gpd.read_parquet(parquet_path)
+        except Exception as exc:
+            print(f"   [Cache] Ignoring unreadable {parquet_path.name}: {exc}")
+
+    gdf = _read_vector(cache_path)
+    try:
+        gdf.to_parquet(parquet_path)
+    except Exception as exc:
+        print(f"   [Cache] GeoParquet cache skipped for {cache_path.name}: {exc}")
+    return gdf
+
+
 def fetch_or_load_geojson(url: str, filename: str, fallback_urls: list[str] | None = None) -> gpd.GeoDataFrame:
     cache_path = _cache_path(filename)
 
     if cache_path.exists():
         print(f"   [Cache] Loading {filename} from local file...")
         try:
-            return gpd.read_file(cache_path)
+            return _read_cached_geojson(cache_path)
         except Exception as exc:
             print(f"Failed to read cached {filename}: {exc}")
             raise SystemExit(1) from exc
@@ -129,7 +156,7 @@ def fetch_or_load_geojson(url: str, filename: str, fallback_urls: list[str] | No
         raise SystemExit(1)
 
     try:
-        return gpd.read_file(cache_path)
+        return _read_cached_geojson(cache_path)
     except Exception as exc:
         print(f"Failed to read downloaded {filename}: {exc}")
         raise SystemExit(1) from exc
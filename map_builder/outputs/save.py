@@ -7,9 +7,19 @@ from pathlib import Path
 
 import geopandas as gpd
 import matplotlib.pyplot as plt
+import shapely
 
 from map_builder import config as cfg
-from map_builder.geo.utils import round_geometries
+from map_builder.geo.utils import round_coordinates
+
+
+def _preview_layer(gdf: gpd.GeoDataFrame) -> gpd.GeoSeries:
+    # Simplify + round in one pass over the geometry array; only the
+    # geometries are needed for plotting, so no frame copy is made.
+    geoms = shapely.simplify(
+        gdf.geometry.to_numpy(), cfg.PREVIEW_SIMPLIFY, preserve_topology=False
+    )
+    return gpd.GeoSeries(round_coordinates(geoms), crs=gdf.crs)
 
 
 def save_outputs(
@@ -26,14 +36,17 @@ def save_outputs(
 ) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
     preview_path = output_dir / "preview.png"
+    if not cfg.PREVIEW_ENABLED:
+        print("Preview rendering disabled (MAPCREATOR_PREVIEW=0); skipping.")
+        return
 
-    land_out = round_geometries(land)
-    rivers_out = round_geometries(rivers)
-    borders_out = round_geometries(border_lines)
-    ocean_out = round_geometries(ocean)
-    land_bg_out = round_geometries(land_bg)
-    urban_out = round_geometries(urban)
-    physical_out = round_geometries(physical)
+    land_out = _preview_layer(land)
+    rivers_out = _preview_layer(rivers)
+    borders_out = _preview_layer(border_lines)
+    ocean_out = _preview_layer(ocean)
+    land_bg_out = _preview_layer(land_bg)
+    urban_out = _preview_layer(urban)
+    physical_out = _preview_layer(physical)
 
     print(f"Saving preview image to {preview_path}...")
     fig, ax = plt.subplots(figsize=(8, 8))
@@ -5,7 +5,12 @@ import geopandas as gpd
 import pandas as pd
 
 from map_builder import config as cfg
-from map_builder.geo.utils import clip_to_europe_bounds, pick_column
+from map_builder.geo.utils import (
+    clean_and_simplify,
+    clip_to_europe_bounds,
+    ensure_crs,
+    pick_column,
+)
 from map_builder.io.fetch import fetch_ne_zip
 
 
@@ -24,7 +29,7 @@ def extract_country_code(id_val: object) -> str:
 
 def build_extension_admin1(land: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     admin1 = fetch_ne_zip(cfg.ADMIN1_URL, "admin1")
-    admin1 = admin1.to_crs("EPSG:4326")
+    admin1 = ensure_crs(admin1)
     admin1 = clip_to_europe_bounds(admin1, "admin1")
 
     name_col = pick_column(admin1, ["adm0_name", "admin", "admin0_name"])
@@ -56,15 +61,15 @@ def build_extension_admin1(land: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
                 "Sri Lanka",
             }
         )
-    ].copy()
+    ]
 
     if admin1.empty:
         print("Admin1 filter returned empty dataset.")
         raise SystemExit(1)
 
     ru_mask = admin1[iso_col].isin({"RU"}) | admin1[name_col].isin({"Russia"})
-    ru = admin1[ru_mask].copy()
-    rest = admin1[~ru_mask].copy()
+    ru = admin1[ru_mask]
+    rest = admin1[~ru_mask]
 
     admin1 = gpd.GeoDataFrame(pd.concat([rest, ru], ignore_index=True), crs="EPSG:4326")
 
@@ -86,7 +91,5 @@ def build_extension_admin1(land: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         admin1["name"] = admin1["name_en"]
 
     admin1 = admin1[["id", "name", "cntr_code", "geometry"]].copy()
-    admin1["geometry"] = admin1.geometry.simplify(
-        tolerance=cfg.SIMPLIFY_ADMIN1, preserve_topology=True
-    )
+    admin1 = clean_and_simplify(admin1, cfg.SIMPLIFY_ADMIN1)
     return admin1
@@ -5,9 +5,14 @@ import json
 
 import geopandas as gpd
 import pandas as pd
+import shapely
 
 from map_builder import config as cfg
-from map_builder.geo.utils import clip_to_europe_bounds
+from map_builder.geo.utils import (
+    clean_and_simplify,
+    clip_to_europe_bounds,
+    ensure_crs,
+)
 from map_builder.io.fetch import fetch_or_load_geojson
 
 
@@ -18,7 +23,7 @@ def apply_china_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         print("[China] cntr_code missing; skipping China replacement.")
         return main_gdf
 
-    base = main_gdf[main_gdf["cntr_code"].astype(str).str.upper() != "CN"].copy()
+    base = main_gdf[main_gdf["cntr_code"].astype(str).str.upper() != "CN"]
 
     print("Downloading China ADM2 (geoBoundaries)...")
     cn_gdf = fetch_or_load_geojson(
@@ -36,16 +41,12 @@ def apply_china_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         sample = cn_gdf.iloc[0].drop(labels=["geometry"], errors="ignore").to_dict()
         print(f"   [Debug] First row sample: {json.dumps(sample, ensure_ascii=True)}")
 
-    cn_gdf = cn_gdf.copy()
     try:
         cn_gdf["geometry"] = cn_gdf.geometry.make_valid()
     except Exception as exc:
         print(f"   [China] make_valid failed; continuing without: {exc}")
 
-    if cn_gdf.crs is None:
-        cn_gdf = cn_gdf.set_crs("EPSG:4326", allow_override=True)
-    if cn_gdf.crs.to_epsg() != 4326:
-        cn_gdf = cn_gdf.to_crs("EPSG:4326")
+    cn_gdf = ensure_crs(cn_gdf)
 
     id_candidates = [
         "shapeID",
@@ -75,30 +76,22 @@ def apply_china_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
             f"Available: {cn_gdf.columns.tolist()}"
         )
 
-    cn_gdf = cn_gdf[cn_gdf.geometry.notna() & ~cn_gdf.geometry.is_empty].copy()
+    # Drop missing/empty geometries and oversized artifacts (square degrees)
+    # with a single mask over the geometry array.
+    geoms = cn_gdf.geometry.to_numpy()
+    present = ~shapely.is_missing(geoms) & ~shapely.is_empty(geoms)
+    keep = present & (shapely.area(geoms) < 50.0)
+    print(f"   [China Clean] Dropped {int((present & ~keep).sum())} oversized artifact(s).")
+    cn_gdf = cn_gdf.loc[keep].reset_index(drop=True)
     cn_gdf = clip_to_europe_bounds(cn_gdf, "china city")
 
-    cn_gdf["temp_area"] = cn_gdf.geometry.area
-    before_count = len(cn_gdf)
-    cn_gdf = cn_gdf[cn_gdf["temp_area"] < 50.0].copy()
-    after_count = len(cn_gdf)
-    print(f"   [China Clean] Dropped {before_count - after_count} oversized artifact(s).")
-    cn_gdf = cn_gdf.drop(columns=["temp_area"])
-
-    try:
-        cn_gdf["geometry"] = cn_gdf.geometry.make_valid()
-    except Exception as exc:
-        print(f"   [China] make_valid failed before simplify; continuing: {exc}")
-
     # Aggressive simplification for geoBoundaries (high-res) to avoid huge files.
-    cn_gdf["geometry"] = cn_gdf.geometry.simplify(
-        tolerance=cfg.SIMPLIFY_CHINA, preserve_topology=True
-    )
+    cn_gdf = clean_and_simplify(cn_gdf, cfg.SIMPLIFY_CHINA)
     cn_gdf["id"] = "CN_CITY_" + cn_gdf[id_col].astype(str)
     cn_gdf["name"] = cn_gdf[name_col].astype(str)
     cn_gdf["name"] = cn_gdf["name"].str.replace("shi", "", regex=False).str.strip()
     cn_gdf["cntr_code"] = "CN"
-    cn_gdf = cn_gdf[["id", "name", "cntr_code", "geometry"]].copy()
+    cn_gdf = cn_gdf[["id", "name", "cntr_code", "geometry"]]
 
     combined = pd.concat([base, cn_gdf], ignore_index=True)
     print(f"[China] Replacement: Loaded {len(cn_gdf)} city regions.")
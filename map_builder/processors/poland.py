@@ -5,8 +5,10 @@ import json
 
 import geopandas as gpd
 import pandas as pd
+import shapely
 
 from map_builder import config as cfg
+from map_builder.geo.utils import clean_and_simplify, ensure_crs
 from map_builder.io.fetch import fetch_or_load_geojson
 
 
@@ -17,7 +19,7 @@ def apply_poland_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         print("[Poland] cntr_code missing; skipping Poland replacement.")
         return main_gdf
 
-    base = main_gdf[main_gdf["cntr_code"].astype(str).str.upper() != "PL"].copy()
+    base = main_gdf[main_gdf["cntr_code"].astype(str).str.upper() != "PL"]
 
     print("Downloading Poland powiaty...")
     pl_gdf = fetch_or_load_geojson(
@@ -35,21 +37,20 @@ def apply_poland_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         sample = pl_gdf.iloc[0].drop(labels=["geometry"], errors="ignore").to_dict()
         print(f"   [Debug] First row sample: {json.dumps(sample, ensure_ascii=True)}")
 
-    pl_gdf = pl_gdf.copy()
     try:
         pl_gdf["geometry"] = pl_gdf.geometry.make_valid()
     except Exception as exc:
         print(f"   [Poland] make_valid failed; continuing without: {exc}")
 
-    if pl_gdf.crs is None:
-        pl_gdf = pl_gdf.set_crs("EPSG:4326", allow_override=True)
-    if pl_gdf.crs.to_epsg() != 4326:
-        pl_gdf = pl_gdf.to_crs("EPSG:4326")
+    pl_gdf = ensure_crs(pl_gdf)
 
-    # Guard against datasets with bogus CRS or empty/invalid geometries.
-    pl_gdf = pl_gdf[~pl_gdf.is_empty].copy()
-    pl_gdf = pl_gdf[pl_gdf.geometry.notna()].copy()
-    pl_gdf = pl_gdf[pl_gdf.geometry.is_valid].copy()
+    # Guard against datasets with bogus CRS or empty/invalid geometries, and
+    # drop oversized artifacts (square degrees), with a single mask.
+    geoms = pl_gdf.geometry.to_numpy()
+    usable = ~shapely.is_missing(geoms) & ~shapely.is_empty(geoms) & shapely.is_valid(geoms)
+    oversized = usable & (shapely.area(geoms) >= 2.0)
+    print(f"   [Poland Clean] Removed {int(oversized.sum())} oversized artifact(s).")
+    pl_gdf = pl_gdf.loc[usable & ~oversized].reset_index(drop=True)
 
     if "terc" not in pl_gdf.columns or "name" not in pl_gdf.columns:
         raise ValueError(
@@ -60,17 +61,8 @@ def apply_poland_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     pl_gdf["id"] = "PL_POW_" + pl_gdf["terc"].astype(str)
     pl_gdf["name"] = pl_gdf["name"].astype(str)
     pl_gdf["cntr_code"] = "PL"
-    # Drop oversized artifacts using area in EPSG:4326 (square degrees).
-    pl_gdf["temp_area"] = pl_gdf.geometry.area
-    before_count = len(pl_gdf)
-    pl_gdf = pl_gdf[pl_gdf["temp_area"] < 2.0].copy()
-    after_count = len(pl_gdf)
-    print(f"   [Poland Clean] Removed {before_count - after_count} oversized artifact(s).")
-    pl_gdf = pl_gdf.drop(columns=["temp_area"])
     pl_gdf = pl_gdf[["id", "name", "cntr_code", "geometry"]].copy()
-    pl_gdf["geometry"] = pl_gdf.geometry.simplify(
-        tolerance=cfg.SIMPLIFY_NUTS3, preserve_topology=True
-    )
+    pl_gdf = clean_and_simplify(pl_gdf, cfg.SIMPLIFY_NUTS3)
 
     combined = pd.concat([base, pl_gdf], ignore_index=True)
     print(f"[Poland] Replacement: Loaded {len(pl_gdf)} counties (Goal: ~380).")
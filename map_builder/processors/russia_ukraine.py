@@ -3,20 +3,18 @@ from __future__ import annotations
 
 import geopandas as gpd
 import pandas as pd
+import shapely
 from shapely.geometry import box
 
 from map_builder import config as cfg
+from map_builder.geo.utils import clean_and_simplify, ensure_crs
 from map_builder.io.fetch import fetch_or_load_geojson
 
 
 def _rep_longitudes(gdf: gpd.GeoDataFrame) -> pd.Series:
-    gdf_ll = gdf
-    if gdf_ll.crs is None:
-        gdf_ll = gdf_ll.set_crs("EPSG:4326", allow_override=True)
-    elif gdf_ll.crs.to_epsg() != 4326:
-        gdf_ll = gdf_ll.to_crs("EPSG:4326")
-    reps = gdf_ll.geometry.representative_point()
-    return reps.x
+    gdf_ll = ensure_crs(gdf)
+    centroids = shapely.centroid(gdf_ll.geometry.to_numpy())
+    return pd.Series(shapely.get_x(centroids), index=gdf.index)
 
 
 def apply_russia_ukraine_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
@@ -28,14 +26,12 @@ def apply_russia_ukraine_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataF
 
     base = main_gdf[
         ~main_gdf["cntr_code"].astype(str).str.upper().isin({"RU", "UA"})
-    ].copy()
+    ]
 
     # Russia: keep Admin-1 east of the Urals
-    ru_admin1 = main_gdf[main_gdf["cntr_code"].astype(str).str.upper() == "RU"].copy()
+    ru_admin1 = main_gdf[main_gdf["cntr_code"].astype(str).str.upper() == "RU"]
     if not ru_admin1.empty:
-        ru_admin1["__rep_lon"] = _rep_longitudes(ru_admin1)
-        ru_east = ru_admin1[ru_admin1["__rep_lon"] >= cfg.URAL_LONGITUDE].copy()
-        ru_east = ru_east.drop(columns=["__rep_lon"])
+        ru_east = ru_admin1.loc[_rep_longitudes(ru_admin1) >= cfg.URAL_LONGITUDE]
     else:
         ru_east = ru_admin1
 
@@ -49,10 +45,7 @@ def apply_russia_ukraine_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataF
     if ru_gdf.empty:
         print("Russia ADM2 GeoDataFrame is empty.")
         raise SystemExit(1)
-    if ru_gdf.crs is None:
-        ru_gdf = ru_gdf.set_crs("EPSG:4326", allow_override=True)
-    if ru_gdf.crs.to_epsg() != 4326:
-        ru_gdf = ru_gdf.to_crs("EPSG:4326")
+    ru_gdf = ensure_crs(ru_gdf)
     # Clip to prevent dateline wrapping artifacts (keep Russia in Eastern Hemisphere)
     clip_box = box(-20.0, 0.0, 179.99, 90.0)
     try:
@@ -64,17 +57,12 @@ def apply_russia_ukraine_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataF
             "Russia ADM2 dataset missing expected columns: shapeID/shapeName. "
             f"Available: {ru_gdf.columns.tolist()}"
         )
-    ru_gdf = ru_gdf.copy()
-    ru_gdf["__rep_lon"] = _rep_longitudes(ru_gdf)
-    ru_gdf = ru_gdf[ru_gdf["__rep_lon"] < cfg.URAL_LONGITUDE].copy()
-    ru_gdf = ru_gdf.drop(columns=["__rep_lon"])
+    ru_gdf = ru_gdf.loc[_rep_longitudes(ru_gdf) < cfg.URAL_LONGITUDE].copy()
     ru_gdf["id"] = "RU_RAY_" + ru_gdf["shapeID"].astype(str)
     ru_gdf["name"] = ru_gdf["shapeName"].astype(str)
     ru_gdf["cntr_code"] = "RU"
     ru_gdf = ru_gdf[["id", "name", "cntr_code", "geometry"]].copy()
-    ru_gdf["geometry"] = ru_gdf.geometry.simplify(
-        tolerance=cfg.SIMPLIFY_RU_UA, preserve_topology=True
-    )
+    ru_gdf = clean_and_simplify(ru_gdf, cfg.SIMPLIFY_RU_UA)
 
     # Ukraine: full ADM2 replacement
     print("Downloading Ukraine ADM2 (geoBoundaries)...")
@@ -86,23 +74,17 @@ def apply_russia_ukraine_replacement(main_gdf: gpd.GeoDataFrame) -> gpd.GeoDataF
     if ua_gdf.empty:
         print("Ukraine ADM2 GeoDataFrame is empty.")
         raise SystemExit(1)
-    if ua_gdf.crs is None:
-        ua_gdf = ua_gdf.set_crs("EPSG:4326", allow_override=True)
-    if ua_gdf.crs.to_epsg() != 4326:
-        ua_gdf = ua_gdf.to_crs("EPSG:4326")
+    ua_gdf = ensure_crs(ua_gdf)
     if "shapeID" not in ua_gdf.columns or "shapeName" not in ua_gdf.columns:
         raise ValueError(
             "Ukraine ADM2 dataset missing expected columns: shapeID/shapeName. "
             f"Available: {ua_gdf.columns.tolist()}"
         )
-    ua_gdf = ua_gdf.copy()
     ua_gdf["id"] = "UA_RAY_" + ua_gdf["shapeID"].astype(str)
     ua_gdf["name"] = ua_gdf["shapeName"].astype(str)
     ua_gdf["cntr_code"] = "UA"
     ua_gdf = ua_gdf[["id", "name", "cntr_code", "geometry"]].copy()
-    ua_gdf["geometry"] = ua_gdf.geometry.simplify(
-        tolerance=cfg.SIMPLIFY_RU_UA, preserve_topology=True
-    )
+    ua_gdf = clean_and_simplify(ua_gdf, cfg.SIMPLIFY_RU_UA)
 
     combined = pd.concat([base, ru_east, ru_gdf, ua_gdf], ignore_index=True)
     print(
@@ -2,22 +2,21 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 
 from map_builder import config as cfg
-from map_builder.geo.utils import pick_column
+from map_builder.geo.utils import (
+    bounds_overlap,
+    clean_and_simplify,
+    ensure_crs,
+    pick_column,
+    union_coverage,
+)
 from map_builder.io.fetch import fetch_ne_zip, fetch_or_load_geojson
 
 
-def _rep_points(gdf: gpd.GeoDataFrame) -> gpd.GeoSeries:
-    gdf_ll = gdf
-    if gdf_ll.crs is None:
-        gdf_ll = gdf_ll.set_crs("EPSG:4326", allow_override=True)
-    elif gdf_ll.crs.to_epsg() != 4326:
-        gdf_ll = gdf_ll.to_crs("EPSG:4326")
-    return gdf_ll.geometry.representative_point()
-
-
 def apply_south_asia_replacement(hybrid_gdf: gpd.GeoDataFrame, land_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     if hybrid_gdf.empty:
         return hybrid_gdf
@@ -25,7 +24,8 @@ def apply_south_asia_replacement(hybrid_gdf: gpd.GeoDataFrame, land_gdf: gpd.Geo
         print("[South Asia] cntr_code missing; skipping replacement.")
         return hybrid_gdf
 
-    base = hybrid_gdf[hybrid_gdf["cntr_code"].astype(str).str.upper() != "IN"].copy()
+    codes = hybrid_gdf["cntr_code"].astype(str).str.upper().to_numpy()
+    base = hybrid_gdf.loc[codes != "IN"]
 
     print("Downloading India ADM2 (geoBoundaries)...")
     ind_gdf = fetch_or_load_geojson(
@@ -38,10 +38,7 @@ def apply_south_asia_replacement(hybrid_gdf: gpd.GeoDataFrame, land_gdf: gpd.Geo
         print("India ADM2 GeoDataFrame is empty.")
         raise SystemExit(1)
 
-    if ind_gdf.crs is None:
-        ind_gdf = ind_gdf.set_crs("EPSG:4326", allow_override=True)
-    if ind_gdf.crs.to_epsg() != 4326:
-        ind_gdf = ind_gdf.to_crs("EPSG:4326")
+    ind_gdf = ensure_crs(ind_gdf)
 
     if "shapeID" not in ind_gdf.columns or "shapeName" not in ind_gdf.columns:
         raise ValueError(
@@ -52,16 +49,25 @@ def apply_south_asia_replacement(hybrid_gdf: gpd.GeoDataFrame, land_gdf: gpd.Geo
     ind_gdf["adm1_name"] = ""
 
     # Island cull using representative points (Andaman/Nicobar + Lakshadweep)
-    reps = _rep_points(ind_gdf)
-    keep_mask = ~((reps.x > 88.0) & (reps.y < 15.0)) & ~((reps.x < 75.0) & (reps.y < 14.0))
+    reps = shapely.point_on_surface(ind_gdf.geometry.to_numpy())
+    rep_x, rep_y = shapely.get_x(reps), shapely.get_y(reps)
+    keep_mask = ~((rep_x > 88.0) & (rep_y < 15.0)) & ~((rep_x < 75.0) & (rep_y < 14.0))
     ind_gdf = ind_gdf.loc[keep_mask].copy()
+    rep_x, rep_y = rep_x[keep_mask], rep_y[keep_mask]
+
+    # Shed vertices before the ADM1 join and China overlay; the final pass
+    # below still simplifies to the configured tolerance.
+    ind_gdf = clean_and_simplify(ind_gdf, cfg.SIMPLIFY_INDIA * 0.5).reset_index(drop=True)
+    # Geometry stays fixed until the China clip, so both the ADM1 lookup and
+    # the clip share this one STRtree.
+    ind_tree = ind_gdf.sindex
 
     # Spatial join ADM2 -> ADM1 to derive state names
     try:
         print("[South Asia] Loading India ADM1 for hierarchy names...")
         adm1 = fetch_ne_zip(cfg.ADMIN1_URL, "admin1_india")
         if not adm1.empty:
-            adm1 = adm1.to_crs("EPSG:4326")
+            adm1 = ensure_crs(adm1)
             iso_col = pick_column(adm1, ["iso_a2", "adm0_a2", "iso_3166_1_", "iso_3166_1_alpha_2"])
             name_col = pick_column(
                 adm1,
@@ -76,13 +82,19 @@ def apply_south_asia_replacement(hybrid_gdf: gpd.GeoDataFrame, land_gdf: gpd.Geo
                     adm1 = adm1[adm1[admin_col].str.contains("India", case=False, na=False)].copy()
 
                 if not adm1.empty:
-                    adm1 = adm1[[name_col, "geometry"]].copy()
-                    joined = gpd.sjoin(ind_gdf, adm1, how="left", predicate="intersects")
-                    if name_col in joined.columns and not joined[name_col].isna().all():
-                        name_map = joined[name_col].groupby(level=0).first()
-                        ind_gdf["adm1_name"] = (
-                            ind_gdf.index.to_series().map(name_map).fillna(ind_gdf["adm1_name"])
-                        )
+                    adm1 = adm1.loc[adm1[name_col].notna(), [name_col, "geometry"]]
+                    adm1_geoms = adm1.geometry.to_numpy()
+                    right, left = ind_tree.query(adm1_geoms, predicate="intersects")
+                    if len(left):
+                        # Prefer the state holding the ADM2 representative point;
+                        # fall back to the first intersecting state otherwise.
+                        inside = shapely.contains_xy(adm1_geoms[right], rep_x[left], rep_y[left])
+                        order = np.lexsort((right, ~inside, left))
+                        left, right = left[order], right[order]
+                        _, first = np.unique(left, return_index=True)
+                        names = ind_gdf["adm1_name"].to_numpy(dtype=object).copy()
+                        names[left[first]] = adm1[name_col].to_numpy()[right[first]]
+                        ind_gdf["adm1_name"] = names
                     else:
                         print("[South Asia] ADM1 join returned no matches; adm1_name left empty.")
                 else:
@@ -97,23 +109,29 @@ def apply_south_asia_replacement(hybrid_gdf: gpd.GeoDataFrame, land_gdf: gpd.Geo
     # Clip India against China geometry to avoid overlaps
     china_geom = None
     try:
-        china = hybrid_gdf[hybrid_gdf["cntr_code"].astype(str).str.upper() == "CN"]
-        if not china.empty:
-            china_geom = china.unary_union
+        china = hybrid_gdf.loc[codes == "CN"]
+        # Only pay for the China union when its extent reaches India at all.
+        if not china.empty and bounds_overlap(china.total_bounds, ind_gdf.total_bounds):
+            china_geom = union_coverage(china.geometry.to_numpy())
     except Exception:
         china_geom = None
 
     if china_geom is not None and not china_geom.is_empty:
         try:
-            ind_gdf["geometry"] = ind_gdf.geometry.apply(lambda geom: geom.difference(china_geom))
+            # The STRtree query only returns ADM2 polygons that really
+            # intersect China; everything else is left untouched.
+            touching = ind_tree.query(china_geom, predicate="intersects")
+            if len(touching):
+                clipped = ind_gdf.geometry.to_numpy().copy()
+                clipped[touching] = shapely.difference(clipped[touching], china_geom)
+                ind_gdf["geometry"] = clipped
         except Exception as exc:
             print(f"[South Asia] China clip failed; continuing without: {exc}")
 
     # Simplify India ADM2
-    ind_gdf = ind_gdf[ind_gdf.geometry.notna() & ~ind_gdf.geometry.is_empty].copy()
-    ind_gdf["geometry"] = ind_gdf.geometry.simplify(
-        tolerance=cfg.SIMPLIFY_INDIA, preserve_topology=True
-    )
+    geoms = ind_gdf.geometry.to_numpy()
+    ind_gdf = ind_gdf.loc[~(shapely.is_missing(geoms) | shapely.is_empty(geoms))]
+    ind_gdf = clean_and_simplify(ind_gdf, cfg.SIMPLIFY_INDIA)
 
     ind_gdf["id"] = "IN_ADM2_" + ind_gdf["shapeID"].astype(str)
     ind_gdf["name"] = ind_gdf["shapeName"].astype(str)
@@ -2,16 +2,37 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point
+import shapely
+from shapely.geometry import Point, Polygon
 
-from map_builder.geo.utils import ensure_crs
+from map_builder.geo.utils import (
+    bounds_overlap,
+    ensure_crs,
+    make_valid_geometries,
+    reproject_geometries,
+)
 
 DISPUTED_AREA_MIN_KM2 = 25.0
 CHERNOBYL_CENTER = (30.099, 51.389)
 CHERNOBYL_RADIUS_M = 30_000
 
 
+def _polygonal_parts(geoms: np.ndarray) -> np.ndarray:
+    # Reduce GeometryCollection results to their polygonal parts; other
+    # geometries pass through for the caller's empty and geom_type filters.
+    collections = shapely.get_type_id(geoms) == 7
+    if not collections.any():
+        return geoms
+    out = geoms.copy()
+    for idx in np.flatnonzero(collections):
+        parts = shapely.get_parts(geoms[idx])
+        polygons = parts[np.isin(shapely.get_type_id(parts), (3, 6))]
+        out[idx] = shapely.union_all(polygons) if len(polygons) else Polygon()
+    return out
+
+
 def _build_disputed_cn_in(
     china_gdf: gpd.GeoDataFrame,
     india_raw_gdf: gpd.GeoDataFrame,
@@ -22,13 +43,20 @@ def _build_disputed_cn_in(
 
     china_gdf = ensure_crs(china_gdf, epsg=4326)
     india_raw_gdf = ensure_crs(india_raw_gdf, epsg=4326)
+    if not bounds_overlap(china_gdf.total_bounds, india_raw_gdf.total_bounds):
+        return gpd.GeoDataFrame(columns=["id", "name", "type", "label", "claimants", "cntr_code", "geometry"], crs="EPSG:4326")
 
     try:
-        inter_gdf = gpd.overlay(india_raw_gdf, china_gdf, how="intersection")
+        # Only intersect the India/China pairs the STRtree reports as touching,
+        # instead of overlaying the full cross product.
+        india_geoms = make_valid_geometries(india_raw_gdf.geometry.to_numpy())
+        china_geoms = make_valid_geometries(china_gdf.geometry.to_numpy())
+        left, right = shapely.STRtree(china_geoms).query(india_geoms, predicate="intersects")
+        pieces = _polygonal_parts(shapely.intersection(india_geoms[left], china_geoms[right]))
     except Exception as exc:
         print(f"[Special Zones] Intersection overlay failed: {exc}")
         return gpd.GeoDataFrame(columns=["id", "name", "type", "label", "claimants", "cntr_code", "geometry"], crs="EPSG:4326")
-    inter_gdf = inter_gdf[["geometry"]].copy()
+    inter_gdf = gpd.GeoDataFrame(geometry=pieces, crs="EPSG:4326")
     inter_gdf = inter_gdf[inter_gdf.geometry.notna() & ~inter_gdf.geometry.is_empty].copy()
     if inter_gdf.empty:
         return gpd.GeoDataFrame(columns=["id", "name", "type", "label", "claimants", "cntr_code", "geometry"], crs="EPSG:4326")
@@ -38,8 +66,9 @@ def _build_disputed_cn_in(
         return gpd.GeoDataFrame(columns=["id", "name", "type", "label", "claimants", "cntr_code", "geometry"], crs="EPSG:4326")
 
     try:
-        areas_km2 = inter_gdf.to_crs("EPSG:6933").geometry.area / 1_000_000.0
-        inter_gdf = inter_gdf.loc[areas_km2 >= min_area_km2].copy()
+        projected = reproject_geometries(inter_gdf.geometry.to_numpy(), inter_gdf.crs, 6933)
+        areas_km2 = shapely.area(projected) / 1_000_000.0
+        inter_gdf = inter_gdf.loc[areas_km2 >= min_area_km2]
     except Exception as exc:
         print(f"[Special Zones] Area filter failed; keeping all intersections: {exc}")
 
@@ -2,6 +2,10 @@ import json
 from collections import Counter
 from pathlib import Path
 
+import numpy as np
+
+EMPTY_BBOX = np.array([np.inf, np.inf, -np.inf, -np.inf], dtype=np.float64)
+
 
 def load_topology(path: Path):
     return json.loads(path.read_text(encoding="utf-8"))
@@ -12,166 +16,155 @@ def bbox_area(bounds):
     return max(0.0, maxx - minx) * max(0.0, maxy - miny)
 
 
-def _arc_bbox(arc, transform):
-    sx, sy = (1.0, 1.0)
-    tx, ty = (0.0, 0.0)
-    if transform:
-        sx, sy = transform.get("scale", [1.0, 1.0])
-        tx, ty = transform.get("translate", [0.0, 0.0])
-    x = 0.0
-    y = 0.0
-    minx = float("inf")
-    miny = float("inf")
-    maxx = float("-inf")
-    maxy = float("-inf")
-    for point in arc:
-        if len(point) < 2:
-            continue
-        dx, dy = point[0], point[1]
-        x += dx
-        y += dy
-        fx = x * sx + tx
-        fy = y * sy + ty
-        if fx < minx:
-            minx = fx
-        if fy < miny:
-            miny = fy
-        if fx > maxx:
-            maxx = fx
-        if fy > maxy:
-            maxy = fy
-    if minx == float("inf"):
-        return None
-    return (minx, miny, maxx, maxy)
+def _transform_params(transform):
+    if not transform:
+        return (1.0, 1.0), (0.0, 0.0)
+    return transform.get("scale", [1.0, 1.0]), transform.get("translate", [0.0, 0.0])
+
+
+def _arc_array(arc):
+    try:
+        arr = np.asarray(arc, dtype=np.float64)
+    except ValueError:
+        arr = None
+    if arr is None or arr.ndim != 2:
+        # Ragged arc: keep only points that carry both deltas.
+        arr = np.asarray([p[:2] for p in arc if len(p) >= 2], dtype=np.float64)
+    if arr.size == 0 or arr.ndim != 2 or arr.shape[1] < 2:
+        return np.empty((0, 2), dtype=np.float64)
+    return arr[:, :2]
 
 
-def _iter_arc_indices(arcs):
+def _decode_arc(arc, transform):
+    scale, translate = _transform_params(transform)
+    return _arc_array(arc).cumsum(axis=0) * scale + translate
+
+
+def _decode_arcs(arcs, transform):
+    lengths = np.fromiter((len(arc) for arc in arcs), dtype=np.int64, count=len(arcs))
+    try:
+        flat = np.asarray([point for arc in arcs for point in arc], dtype=np.float64)
+    except ValueError:
+        flat = None
+    if flat is None or flat.ndim != 2 or flat.shape[1] < 2:
+        # Ragged points: fall back to cleaning each arc on its own.
+        arc_coords_cache = [_decode_arc(arc, transform) for arc in arcs]
+        arc_bboxes = np.array(
+            [_arc_bbox(coords) for coords in arc_coords_cache], dtype=np.float64
+        ).reshape(len(arcs), 4)
+        return arc_coords_cache, arc_bboxes
+
+    # One cumulative sum over every arc, rebased so each arc starts from zero.
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    starts = offsets[:-1]
+    totals = flat[:, :2].cumsum(axis=0)
+    before = np.zeros((len(arcs), 2), dtype=np.float64)
+    nonempty = lengths > 0
+    before[nonempty & (starts > 0)] = totals[starts[nonempty & (starts > 0)] - 1]
+    scale, translate = _transform_params(transform)
+    coords = (totals - np.repeat(before, lengths, axis=0)) * scale + translate
+    arc_coords_cache = np.split(coords, offsets[1:-1])
+
+    arc_bboxes = np.tile(EMPTY_BBOX, (len(arcs), 1))
+    if nonempty.any():
+        seg_starts = starts[nonempty]
+        arc_bboxes[nonempty, :2] = np.minimum.reduceat(coords, seg_starts)
+        arc_bboxes[nonempty, 2:] = np.maximum.reduceat(coords, seg_starts)
+    return arc_coords_cache, arc_bboxes
+
+
+def _arc_bbox(coords):
+    if coords.shape[0] == 0:
+        return EMPTY_BBOX
+    return np.concatenate((coords.min(axis=0), coords.max(axis=0)))
+
+
+def _flatten_arcs(arcs, out):
     if isinstance(arcs, int):
-        yield arcs
+        out.append(arcs)
     elif isinstance(arcs, list):
         for item in arcs:
-            yield from _iter_arc_indices(item)
+            _flatten_arcs(item, out)
+    return out
 
 
-def _geometry_bbox(geom, arc_bboxes):
-    arcs = geom.get("arcs")
-    if arcs is None:
+def _flat_arc_indices(arcs, n_arcs):
+    # Negative indices reference reversed arcs; only the arc id matters here.
+    idx = np.asarray(_flatten_arcs(arcs, []), dtype=np.int64)
+    idx = np.where(idx < 0, ~idx, idx)
+    return idx[idx < n_arcs]
+
+
+def _bounds_for(idx, arc_bboxes):
+    # Empty arcs hold (inf, inf, -inf, -inf) rows, so they never win a reduction.
+    if idx.size == 0:
         return None
-    minx = float("inf")
-    miny = float("inf")
-    maxx = float("-inf")
-    maxy = float("-inf")
-    for arc_idx in _iter_arc_indices(arcs):
-        if not isinstance(arc_idx, int):
-            continue
-        if arc_idx < 0:
-            arc_idx = ~arc_idx
-        if arc_idx < 0 or arc_idx >= len(arc_bboxes):
-            continue
-        bbox = arc_bboxes[arc_idx]
-        if not bbox:
-            continue
-        bx0, by0, bx1, by1 = bbox
-        if bx0 < minx:
-            minx = bx0
-        if by0 < miny:
-            miny = by0
-        if bx1 > maxx:
-            maxx = bx1
-        if by1 > maxy:
-            maxy = by1
+    bbs = arc_bboxes[idx]
+    minx, miny = bbs[:, :2].min(axis=0).tolist()
+    maxx, maxy = bbs[:, 2:].max(axis=0).tolist()
     if minx == float("inf"):
         return None
     return (minx, miny, maxx, maxy)
 
 
-def _decode_arc(arc, transform):
-    sx, sy = (1.0, 1.0)
-    tx, ty = (0.0, 0.0)
-    if transform:
-        sx, sy = transform.get("scale", [1.0, 1.0])
-        tx, ty = transform.get("translate", [0.0, 0.0])
-    x = 0.0
-    y = 0.0
-    coords = []
-    for point in arc:
-        if len(point) < 2:
-            continue
-        dx, dy = point[0], point[1]
-        x += dx
-        y += dy
-        coords.append((x * sx + tx, y * sy + ty))
-    return coords
-
-
 def _ring_area(coords):
-    if not coords or len(coords) < 3:
+    if len(coords) < 3:
         return 0.0
-    area = 0.0
-    x0, y0 = coords[-1]
-    for x1, y1 in coords:
-        area += (x0 * y1) - (x1 * y0)
-        x0, y0 = x1, y1
-    return area / 2.0
+    x = coords[:, 0]
+    y = coords[:, 1]
+    return float(np.dot(np.roll(x, 1), y) - np.dot(x, np.roll(y, 1))) / 2.0
 
 
 def _build_ring(arc_indices, arc_coords_cache):
-    ring = []
+    parts = []
     for arc_idx in arc_indices:
         if arc_idx < 0:
-            arc_idx = ~arc_idx
-            coords = list(reversed(arc_coords_cache[arc_idx]))
+            coords = arc_coords_cache[~arc_idx][::-1]
         else:
             coords = arc_coords_cache[arc_idx]
-        if not coords:
+        if len(coords) == 0:
             continue
-        if ring:
-            ring.extend(coords[1:])
-        else:
-            ring.extend(coords)
-    return ring
+        # Consecutive arcs share their junction vertex.
+        parts.append(coords[1:] if parts else coords)
+    if not parts:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.concatenate(parts)
 
 
-def _geometry_area(geom, arc_coords_cache):
+def _polygon_area(rings):
+    outer = abs(_ring_area(rings[0]))
+    holes = sum(abs(_ring_area(r)) for r in rings[1:])
+    return max(outer - holes, 0.0)
+
+
+def _geometry_stats(geom, arc_bboxes, arc_coords_cache):
     arcs = geom.get("arcs")
     if arcs is None:
-        return 0.0
+        return None, 0.0
 
+    bbox = _bounds_for(_flat_arc_indices(arcs, len(arc_bboxes)), arc_bboxes)
     geom_type = geom.get("type")
-    total_area = 0.0
-
     if geom_type == "Polygon":
+        polygons = [arcs]
+    elif geom_type == "MultiPolygon":
+        polygons = arcs
+    else:
+        return bbox, 0.0
+
+    total_area = 0.0
+    for poly in polygons:
+        if not isinstance(poly, list):
+            continue
         rings = []
-        for ring_arcs in arcs:
+        for ring_arcs in poly:
             if not isinstance(ring_arcs, list):
                 continue
             ring = _build_ring(ring_arcs, arc_coords_cache)
-            if ring:
+            if len(ring):
                 rings.append(ring)
         if rings:
-            outer = abs(_ring_area(rings[0]))
-            holes = sum(abs(_ring_area(r)) for r in rings[1:])
-            total_area += max(outer - holes, 0.0)
-        return total_area
-
-    if geom_type == "MultiPolygon":
-        for poly in arcs:
-            if not isinstance(poly, list):
-                continue
-            rings = []
-            for ring_arcs in poly:
-                if not isinstance(ring_arcs, list):
-                    continue
-                ring = _build_ring(ring_arcs, arc_coords_cache)
-                if ring:
-                    rings.append(ring)
-            if rings:
-                outer = abs(_ring_area(rings[0]))
-                holes = sum(abs(_ring_area(r)) for r in rings[1:])
-                total_area += max(outer - holes, 0.0)
-        return total_area
-
-    return 0.0
+            total_area += _polygon_area(rings)
+    return bbox, total_area
 
 
 def main():
@@ -193,63 +186,67 @@ def main():
     # Precompute arc bboxes and decoded coordinates for TopoJSON
     arcs = topo.get("arcs", [])
     transform = topo.get("transform")
-    arc_bboxes = [_arc_bbox(arc, transform) for arc in arcs]
-    arc_coords_cache = [_decode_arc(arc, transform) for arc in arcs]
-
-    all_bounds = []
-    for geom in geoms:
-        bbox = _geometry_bbox(geom, arc_bboxes)
-        if bbox:
-            all_bounds.append(bbox)
-    if not all_bounds:
-        raise SystemExit("Unable to compute geometry bboxes from topology arcs")
-
-    minx = min(b[0] for b in all_bounds)
-    miny = min(b[1] for b in all_bounds)
-    maxx = max(b[2] for b in all_bounds)
-    maxy = max(b[3] for b in all_bounds)
-    full_area = bbox_area((minx, miny, maxx, maxy))
+    arc_coords_cache, arc_bboxes = _decode_arcs(arcs, transform)
 
-    print("Topology extent bounds:", (minx, miny, maxx, maxy))
-    print("Topology extent bbox area:", full_area)
-
-    # Check 1 - massive artifacts
-    suspicious = []
+    # Single pass: per-feature bbox/area, extent, metadata and id counts.
+    minx = miny = float("inf")
+    maxx = maxy = float("-inf")
     widths = []
     area_by_country = Counter()
     ru_crosses_dateline = False
+    missing_cntr = []
+    id_counts = Counter()
     for geom in geoms:
-        bbox = _geometry_bbox(geom, arc_bboxes)
-        if not bbox:
-            continue
-        area = bbox_area(bbox)
-        width = max(0.0, bbox[2] - bbox[0])
-        props = geom.get("properties", {})
+        props = geom.get("properties", {}) or {}
         geom_id = props.get("id")
         cntr_code = props.get("cntr_code")
+        if not cntr_code:
+            missing_cntr.append(geom_id)
+        if geom_id:
+            id_counts[geom_id] += 1
+
+        bbox, geom_area = _geometry_stats(geom, arc_bboxes, arc_coords_cache)
+        if not bbox:
+            continue
+        minx = min(minx, bbox[0])
+        miny = min(miny, bbox[1])
+        maxx = max(maxx, bbox[2])
+        maxy = max(maxy, bbox[3])
         widths.append(
             {
                 "id": geom_id,
                 "cntr_code": cntr_code,
-                "width": width,
+                "width": max(0.0, bbox[2] - bbox[0]),
                 "bbox": bbox,
             }
         )
-        geom_area = _geometry_area(geom, arc_coords_cache)
         if cntr_code:
             area_by_country[cntr_code] += geom_area
-
         if cntr_code == "RU" and bbox[0] < -170 and bbox[2] > 170:
             ru_crosses_dateline = True
-        if full_area > 0 and area / full_area > 0.5:
-            suspicious.append(
-                {
-                    "id": geom_id,
-                    "cntr_code": cntr_code,
-                    "area_ratio": area / full_area,
-                    "bbox": bbox,
-                }
-            )
+
+    if not widths:
+        raise SystemExit("Unable to compute geometry bboxes from topology arcs")
+
+    full_area = bbox_area((minx, miny, maxx, maxy))
+
+    print("Topology extent bounds:", (minx, miny, maxx, maxy))
+    print("Topology extent bbox area:", full_area)
+
+    # Check 1 - massive artifacts
+    suspicious = []
+    if full_area > 0:
+        for entry in widths:
+            area_ratio = bbox_area(entry["bbox"]) / full_area
+            if area_ratio > 0.5:
+                suspicious.append(
+                    {
+                        "id": entry["id"],
+                        "cntr_code": entry["cntr_code"],
+                        "area_ratio": area_ratio,
+                        "bbox": entry["bbox"],
+                    }
+                )
 
     if suspicious:
         print("\nSuspicious Giant Artifacts (>50% extent):")
@@ -269,11 +266,6 @@ def main():
         )
 
     # Check 2 - missing metadata
-    missing_cntr = [
-        (geom.get("properties", {}) or {}).get("id")
-        for geom in geoms
-        if not (geom.get("properties", {}) or {}).get("cntr_code")
-    ]
     print(f"\nMissing cntr_code count: {len(missing_cntr)}")
     if missing_cntr:
         print("Sample missing cntr_code IDs:", missing_cntr[:20])
@@ -290,13 +282,7 @@ def main():
         print("\nRussia dateline crossing: not detected")
 
     # Check 3 - duplicate IDs
-    ids = [
-        (geom.get("properties", {}) or {}).get("id")
-        for geom in geoms
-        if (geom.get("properties", {}) or {}).get("id")
-    ]
-    counts = Counter(ids)
-    dups = [k for k, v in counts.items() if v > 1]
+    dups = [k for k, v in id_counts.items() if v > 1]
     print(f"\nDuplicate id count: {len(dups)}")
     if dups:
         sample = dups[:20]
@@ -1,11 +1,9 @@
 import http.server
 import socketserver
 import webbrowser
-import sys
 
-# Define the range of ports to try
+# Preferred port; if it is taken the OS hands out a free ephemeral port instead
 PORT_START = 8000
-PORT_END = 8010
 BIND_ADDRESS = "127.0.0.1"
 
 class Handler(http.server.SimpleHTTPRequestHandler):
@@ -14,35 +12,24 @@ class Handler(http.server.SimpleHTTPRequestHandler):
         pass
 
 def start_server():
-    for port in range(PORT_START, PORT_END + 1):
-        try:
-            # Attempt to create the server
-            # allow_reuse_address=False on Windows helps avoid some zombie socket issues,
-            # but binding to a new port is the safest bet.
-            httpd = socketserver.TCPServer((BIND_ADDRESS, port), Handler)
-
-            print(f"[INFO] Success! Server started at http://{BIND_ADDRESS}:{port}")
-            print(f"[INFO] (If the browser doesn't open, please visit the URL manually)")
-
-            # Open browser
-            webbrowser.open(f"http://{BIND_ADDRESS}:{port}")
-
-            # Start serving
-            httpd.serve_forever()
-            return  # Exit function after server stops (though serve_forever usually blocks)
-
-        except OSError as e:
-            # WinError 10048 is "Address already in use"
-            if e.errno == 10048 or "Address already in use" in str(e) or "通常每个套接字地址" in str(e):
-                print(f"[WARN] Port {port} is busy. Trying {port + 1}...")
-                continue
-            else:
-                # Some other error occurred
-                print(f"[ERROR] Unexpected error on port {port}: {e}")
-                raise e
-
-    print(f"[FATAL] Could not find any open port between {PORT_START} and {PORT_END}.")
-    sys.exit(1)
+    try:
+        httpd = socketserver.TCPServer((BIND_ADDRESS, PORT_START), Handler)
+    except OSError as e:
+        # Port 0 lets the kernel pick a free port in a single bind call,
+        # instead of probing a range and matching localized error strings.
+        print(f"[WARN] Port {PORT_START} is unavailable ({e}). Asking the OS for a free port...")
+        httpd = socketserver.TCPServer((BIND_ADDRESS, 0), Handler)
+
+    port = httpd.server_address[1]
+    print(f"[INFO] Success! Server started at http://{BIND_ADDRESS}:{port}")
+    print(f"[INFO] (If the browser doesn't open, please visit the URL manually)")
+
+    # Open browser
+    webbrowser.open(f"http://{BIND_ADDRESS}:{port}")
+
+    # Start serving
+    with httpd:
+        httpd.serve_forever()
 
 if __name__ == "__main__":
     start_server()
@@ -1,12 +1,19 @@
 ﻿import json
+import os
 import re
 import sys
 import zipfile
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
 
 try:
     import geopandas as gpd
+    import numpy as np
+    import pandas as pd
+    import shapely
+    from pyproj import Transformer
 except ImportError as exc:
     raise SystemExit(
         "geopandas is required. Install with: uv pip install geopandas"
@@ -19,6 +26,11 @@ except ImportError as exc:
         "requests is required. Install with: uv pip install requests"
     ) from exc
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 DEFAULT_CHINA_ADM2 = DATA_DIR / "china_adm2.geojson"
 DEFAULT_FR_ARR = DATA_DIR / "france_arrondissements.geojson"
@@ -26,6 +38,8 @@ DEFAULT_PL_POW = DATA_DIR / "poland_powiaty.geojson"
 DEFAULT_IND_ADM2 = DATA_DIR / "geoBoundaries-IND-ADM2.geojson"
 DEFAULT_RUS_ADM2 = DATA_DIR / "geoBoundaries-RUS-ADM2.geojson"
 DEFAULT_UKR_ADM2 = DATA_DIR / "geoBoundaries-UKR-ADM2.geojson"
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+SHAPEFILE_SUFFIXES = (".shp", ".shx", ".dbf", ".prj", ".cpg")
 NE_ADMIN1_URL = "https://naturalearth.s3.amazonaws.com/10m_cultural/ne_10m_admin_1_states_provinces.zip"
 
 DEFAULT_NE_ADM1_CANDIDATES = [
@@ -42,6 +56,18 @@ ADMIN1_ISO_COLS = ["iso_a2", "adm0_a2", "iso_3166_1_", "iso_3166_1_alpha_2"]
 ADMIN1_ADM0_COLS = ["admin", "adm0_name", "admin0_name"]
 ADMIN1_ID_COLS = ["adm1_code", "gn_id", "id"]
 URAL_LONGITUDE = 60.0
+ADM2_READ_COLS = ["shapeID"]
+ADMIN1_READ_COLS = list(
+    dict.fromkeys(
+        CN_NAME_COLS
+        + CN_TYPE_COLS
+        + ADMIN1_NAME_COLS
+        + ADMIN1_ISO_COLS
+        + ADMIN1_ADM0_COLS
+        + ADMIN1_ID_COLS
+        + ["adm0_a3"]
+    )
+)
 
 POLAND_VOIVODESHIPS = {
     "02": "Lower Silesian",
@@ -167,6 +193,9 @@ FR_DEPT_TO_REGION = {
     "976": "Mayotte",
 }
 
+VOIVODESHIP_LOOKUP = pd.Series(POLAND_VOIVODESHIPS)
+FR_REGION_LOOKUP = pd.Series(FR_DEPT_TO_REGION)
+
 
 def pick_column(columns, candidates):
     for col in candidates:
@@ -175,6 +204,19 @@ def pick_column(columns, candidates):
     return None
 
 
+def read_vector(path, columns=None):
+    # pyogrio + Arrow reads whole layers into columnar buffers and skips
+    # unrequested attributes; columns missing from a file are ignored.
+    try:
+        return gpd.read_file(path, engine="pyogrio", use_arrow=True, columns=columns)
+    except ImportError:
+        gdf = gpd.read_file(path)
+        if columns:
+            keep = [col for col in gdf.columns if col in columns or col == gdf.geometry.name]
+            gdf = gdf[keep]
+        return gdf
+
+
 def filter_admin1_by_iso(adm1, iso_code, fallback_names=None):
     iso_col = pick_column(adm1.columns, ADMIN1_ISO_COLS)
     if iso_col:
@@ -185,6 +227,18 @@ def filter_admin1_by_iso(adm1, iso_code, fallback_names=None):
     return adm1.copy()
 
 
+def split_admin1_by_iso(adm1, iso_codes):
+    # One groupby pass instead of a full-column equality scan per country.
+    # Without an ISO column every country gets the whole frame and
+    # filter_admin1_by_iso falls back to matching names.
+    iso_col = pick_column(adm1.columns, ADMIN1_ISO_COLS)
+    if not iso_col:
+        return {iso_code: adm1 for iso_code in iso_codes}
+    subset = adm1[adm1[iso_col].isin(iso_codes)]
+    by_iso = dict(tuple(subset.groupby(iso_col, sort=False)))
+    return {iso_code: by_iso.get(iso_code, adm1.iloc[0:0]) for iso_code in iso_codes}
+
+
 def ensure_crs(gdf, epsg=4326):
     if gdf.crs is None:
         gdf = gdf.set_crs(f"EPSG:{epsg}", allow_override=True)
@@ -193,27 +247,85 @@ def ensure_crs(gdf, epsg=4326):
     return gdf
 
 
+@lru_cache(maxsize=8)
+def get_transformer(src, dst):
+    return Transformer.from_crs(src, dst, always_xy=True)
+
+
 def centroid_points(gdf, epsg=3857):
     original_crs = gdf.crs
     if original_crs is None:
         gdf = gdf.set_crs("EPSG:4326", allow_override=True)
         original_crs = gdf.crs
-    projected = gdf.to_crs(f"EPSG:{epsg}")
-    projected = projected.copy()
-    projected["geometry"] = projected.geometry.centroid
-    return projected.to_crs(original_crs)
+    forward = get_transformer(original_crs, f"EPSG:{epsg}")
+    projected = shapely.transform(
+        gdf.geometry.to_numpy(),
+        lambda coords: np.column_stack(forward.transform(coords[:, 0], coords[:, 1])),
+    )
+    centroids = shapely.centroid(projected)
+    inverse = get_transformer(f"EPSG:{epsg}", original_crs)
+    xs, ys = inverse.transform(shapely.get_x(centroids), shapely.get_y(centroids))
+    return gpd.GeoDataFrame(
+        gdf.drop(columns=gdf.geometry.name),
+        geometry=shapely.points(xs, ys),
+        crs=original_crs,
+    )
 
 def representative_longitudes(gdf):
+    # Only the side of the Urals matters, so a vectorized centroid is enough;
+    # bbox midpoints would misplace antimeridian-spanning Chukotka.
     gdf = ensure_crs(gdf)
-    reps = gdf.geometry.representative_point()
-    return reps.x
+    centroids = shapely.centroid(gdf.geometry.to_numpy())
+    return pd.Series(shapely.get_x(centroids), index=gdf.index)
 
 
+@lru_cache(maxsize=4096)
 def slugify(text):
-    cleaned = re.sub(r"[^A-Za-z0-9]+", "_", str(text).strip())
+    cleaned = _SLUG_RE.sub("_", str(text).strip())
     return cleaned.strip("_")
 
 
+def named_rows(names):
+    return (names.notna() & names.astype(str).str.strip().ne("")).to_numpy()
+
+
+def group_rows(group_ids, child_ids, label_values):
+    frame = pd.DataFrame(
+        {
+            "group": np.asarray(group_ids, dtype=object),
+            "child": np.asarray(child_ids, dtype=object),
+            "label": np.asarray(label_values, dtype=object),
+        }
+    )
+    # Hash-based dedupe keeps the first occurrence, so child order within a
+    # group stays in source row order.
+    frame = frame.drop_duplicates(["group", "child"])
+    groups = frame.groupby("group", sort=False)["child"].agg(list).to_dict()
+    labels = frame.drop_duplicates("group").set_index("group")["label"].to_dict()
+    return groups, labels
+
+
+def join_admin1(points, adm1, columns):
+    # One STRtree batch query replaces sjoin(within) + sjoin_nearest: points
+    # outside every polygon fall back to their single nearest polygon.
+    point_geoms = points.geometry.to_numpy()
+    tree = shapely.STRtree(adm1.geometry.to_numpy())
+    left, right = tree.query(point_geoms, predicate="within")
+    unmatched = np.setdiff1d(np.arange(len(point_geoms)), left)
+    if len(unmatched) and len(adm1):
+        near_left, near_right = tree.query_nearest(point_geoms[unmatched], all_matches=False)
+        left = np.concatenate([left, unmatched[near_left]])
+        right = np.concatenate([right, near_right])
+    order = np.lexsort((right, left))
+    left, right = left[order], right[order]
+
+    joined = pd.DataFrame(points.drop(columns=points.geometry.name)).iloc[left]
+    joined = joined.reset_index(drop=True)
+    for col in columns:
+        joined[col] = adm1[col].to_numpy()[right]
+    return joined
+
+
 def find_ne_admin1(data_dir: Path):
     for candidate in DEFAULT_NE_ADM1_CANDIDATES:
         if candidate.exists():
@@ -225,20 +337,61 @@ def find_ne_admin1(data_dir: Path):
                 return path
     return None
 
+def read_download_meta(meta_path: Path):
+    try:
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
 def download_admin1_to_data(data_dir: Path):
     print("Downloading Natural Earth admin1 for hierarchy...")
     zip_path = data_dir / "ne_10m_admin_1_states_provinces.zip"
+    tmp_path = zip_path.with_suffix(zip_path.suffix + ".tmp")
+    meta_path = zip_path.with_suffix(".meta.json")
+
+    # Revalidate an existing zip instead of fetching ~50 MB again.
+    headers = {}
+    if zip_path.exists() and zip_path.stat().st_size > 0:
+        meta = read_download_meta(meta_path)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        headers["If-Modified-Since"] = meta.get("last_modified") or formatdate(
+            zip_path.stat().st_mtime, usegmt=True
+        )
+
     try:
-        response = requests.get(NE_ADMIN1_URL, timeout=(10, 120))
-        response.raise_for_status()
-        zip_path.write_bytes(response.content)
+        with requests.get(
+            NE_ADMIN1_URL,
+            headers=headers,
+            stream=True,
+            timeout=(10, 120),
+        ) as response:
+            if response.status_code == 304:
+                print(f"Using cached file: {zip_path}")
+            else:
+                response.raise_for_status()
+                with tmp_path.open("wb") as handle:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        if chunk:
+                            handle.write(chunk)
+                tmp_path.replace(zip_path)
+                meta = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
     except requests.RequestException as exc:
         print(f"Failed to download admin1: {exc}")
+        if tmp_path.exists():
+            tmp_path.unlink()
         return None
 
     try:
         with zipfile.ZipFile(zip_path) as zf:
-            zf.extractall(data_dir)
+            for member in zf.namelist():
+                if member.lower().endswith(SHAPEFILE_SUFFIXES):
+                    zf.extract(member, data_dir)
     except zipfile.BadZipFile as exc:
         print(f"Failed to extract admin1 zip: {exc}")
         return None
@@ -246,15 +399,13 @@ def download_admin1_to_data(data_dir: Path):
     return find_ne_admin1(data_dir)
 
 
-def build_china_groups(adm2_path: Path, adm1_path: Path):
-    adm2 = gpd.read_file(adm2_path)
+def build_china_groups(adm2_path: Path, adm1: gpd.GeoDataFrame):
+    adm2 = read_vector(adm2_path, columns=ADM2_READ_COLS)
     if "shapeID" not in adm2.columns:
         raise ValueError("China ADM2 missing shapeID column.")
     adm2 = ensure_crs(adm2)
     centroids = centroid_points(adm2)
 
-    adm1 = gpd.read_file(adm1_path)
-    adm1 = ensure_crs(adm1)
     admin_col = "admin" if "admin" in adm1.columns else None
     if admin_col:
         adm1_china = adm1[adm1[admin_col] == "China"].copy()
@@ -271,93 +422,46 @@ def build_china_groups(adm2_path: Path, adm1_path: Path):
     keep_cols = [name_col]
     if type_col:
         keep_cols.append(type_col)
-    adm1_china = adm1_china[keep_cols + ["geometry"]].copy()
-
-    joined = gpd.sjoin(centroids, adm1_china, how="left", predicate="within")
-
-    if joined[name_col].isna().any():
-        try:
-            missing = joined[name_col].isna()
-            nearest = gpd.sjoin_nearest(
-                centroids.loc[missing].copy(),
-                adm1_china,
-                how="left",
-                distance_col="distance",
-            )
-            joined.loc[missing, name_col] = nearest[name_col].values
-            if type_col:
-                joined.loc[missing, type_col] = nearest[type_col].values
-        except Exception:
-            pass
+    joined = join_admin1(centroids, adm1_china, keep_cols)
 
-    groups = defaultdict(list)
-    labels = {}
-
-    for _, row in joined.iterrows():
-        province = row.get(name_col)
-        if not province or str(province).strip() == "":
-            continue
-        group_id = f"CN_{slugify(province)}"
-        child_id = f"CN_CITY_{row['shapeID']}"
-        groups[group_id].append(child_id)
-        if group_id not in labels:
-            if type_col and row.get(type_col):
-                labels[group_id] = f"{province} {row.get(type_col)}"
-            else:
-                labels[group_id] = str(province)
+    keep = named_rows(joined[name_col])
+    province = joined[name_col][keep].astype(str)
+    group_ids = "CN_" + province.map(slugify)
+    child_ids = "CN_CITY_" + joined["shapeID"][keep].astype(str)
+    label_values = province
+    if type_col:
+        kind = joined[type_col][keep]
+        has_kind = kind.notna() & kind.astype(str).ne("")
+        label_values = province.where(~has_kind, province + " " + kind.astype(str))
 
-    return groups, labels
+    return group_rows(group_ids, child_ids, label_values)
 
 
-def build_admin2_groups(adm2_path: Path, adm1_path: Path, iso_code: str, child_prefix: str, country_names=None):
-    adm2 = gpd.read_file(adm2_path)
+def build_admin2_groups(adm2_path: Path, adm1: gpd.GeoDataFrame, iso_code: str, child_prefix: str, country_names=None):
+    adm2 = read_vector(adm2_path, columns=ADM2_READ_COLS)
     if "shapeID" not in adm2.columns:
         raise ValueError(f"{iso_code} ADM2 missing shapeID column.")
     adm2 = ensure_crs(adm2)
     centroids = centroid_points(adm2)
 
-    adm1 = gpd.read_file(adm1_path)
-    adm1 = ensure_crs(adm1)
     adm1_country = filter_admin1_by_iso(adm1, iso_code, fallback_names=country_names)
 
     name_col = pick_column(adm1_country.columns, ADMIN1_NAME_COLS)
     if not name_col:
         raise ValueError(f"{iso_code} ADM1 missing name columns.")
 
-    adm1_country = adm1_country[[name_col, "geometry"]].copy()
-    joined = gpd.sjoin(centroids, adm1_country, how="left", predicate="within")
+    joined = join_admin1(centroids, adm1_country, [name_col])
 
-    if joined[name_col].isna().any():
-        try:
-            missing = joined[name_col].isna()
-            nearest = gpd.sjoin_nearest(
-                centroids.loc[missing].copy(),
-                adm1_country,
-                how="left",
-                distance_col="distance",
-            )
-            joined.loc[missing, name_col] = nearest[name_col].values
-        except Exception:
-            pass
+    keep = named_rows(joined[name_col])
+    region = joined[name_col][keep].astype(str)
+    group_ids = f"{child_prefix}_" + region.map(slugify)
+    child_ids = f"{child_prefix}_RAY_" + joined["shapeID"][keep].astype(str)
 
-    groups = defaultdict(list)
-    labels = {}
+    return group_rows(group_ids, child_ids, region)
 
-    for _, row in joined.iterrows():
-        region = row.get(name_col)
-        if not region or str(region).strip() == "":
-            continue
-        group_id = f"{child_prefix}_{slugify(region)}"
-        child_id = f"{child_prefix}_RAY_{row['shapeID']}"
-        groups[group_id].append(child_id)
-        if group_id not in labels:
-            labels[group_id] = str(region)
 
-    return groups, labels
-
-
-def build_india_groups(adm2_path: Path, adm1_path: Path | None = None):
-    gdf = gpd.read_file(adm2_path)
+def build_india_groups(adm2_path: Path, adm1: gpd.GeoDataFrame | None = None):
+    gdf = read_vector(adm2_path, columns=ADM2_READ_COLS + ["adm1_name"])
     if "shapeID" not in gdf.columns:
         raise ValueError("India ADM2 missing shapeID column.")
 
@@ -369,10 +473,8 @@ def build_india_groups(adm2_path: Path, adm1_path: Path | None = None):
         gdf["adm1_name"] = ""
 
     needs_join = gdf["adm1_name"].str.strip().eq("").all()
-    if needs_join and adm1_path:
+    if needs_join and adm1 is not None:
         try:
-            adm1 = gpd.read_file(adm1_path)
-            adm1 = ensure_crs(adm1)
             iso_col = pick_column(adm1.columns, ADMIN1_ISO_COLS)
             name_col = pick_column(adm1.columns, ADMIN1_NAME_COLS)
             admin_col = pick_column(adm1.columns, ADMIN1_ADM0_COLS)
@@ -392,25 +494,15 @@ def build_india_groups(adm2_path: Path, adm1_path: Path | None = None):
         except Exception:
             pass
 
-    groups = defaultdict(list)
-    labels = {}
-
-    for _, row in gdf.iterrows():
-        region = str(row.get("adm1_name", "")).strip()
-        if not region:
-            region = "Other"
-        group_id = f"IN_{slugify(region)}"
-        child_id = f"IN_ADM2_{row['shapeID']}"
-        if child_id not in groups[group_id]:
-            groups[group_id].append(child_id)
-        if group_id not in labels:
-            labels[group_id] = f"IN - {region}"
+    region = gdf["adm1_name"].astype(str).str.strip().replace("", "Other")
+    group_ids = "IN_" + region.map(slugify)
+    child_ids = "IN_ADM2_" + gdf["shapeID"].astype(str)
 
-    return groups, labels
+    return group_rows(group_ids, child_ids, "IN - " + region)
 
 
-def build_russia_groups_hybrid(adm2_path: Path, adm1_path: Path):
-    adm2 = gpd.read_file(adm2_path)
+def build_russia_groups_hybrid(adm2_path: Path, adm1: gpd.GeoDataFrame):
+    adm2 = read_vector(adm2_path, columns=ADM2_READ_COLS)
     if "shapeID" not in adm2.columns:
         raise ValueError("RU ADM2 missing shapeID column.")
     adm2 = ensure_crs(adm2)
@@ -421,45 +513,25 @@ def build_russia_groups_hybrid(adm2_path: Path, adm1_path: Path):
     except Exception:
         adm2_west = adm2.copy()
 
-    adm1 = gpd.read_file(adm1_path)
-    adm1 = ensure_crs(adm1)
     adm1_country = filter_admin1_by_iso(adm1, "RU", fallback_names=["Russia"])
 
     name_col = pick_column(adm1_country.columns, ADMIN1_NAME_COLS)
     if not name_col:
         raise ValueError("RU ADM1 missing name columns.")
 
-    groups = defaultdict(list)
-    labels = {}
+    group_ids = []
+    child_ids = []
+    label_values = []
 
     if not adm2_west.empty:
         centroids = centroid_points(adm2_west)
-        adm1_join = adm1_country[[name_col, "geometry"]].copy()
-        joined = gpd.sjoin(centroids, adm1_join, how="left", predicate="within")
-
-        if joined[name_col].isna().any():
-            try:
-                missing = joined[name_col].isna()
-                nearest = gpd.sjoin_nearest(
-                    centroids.loc[missing].copy(),
-                    adm1_join,
-                    how="left",
-                    distance_col="distance",
-                )
-                joined.loc[missing, name_col] = nearest[name_col].values
-            except Exception:
-                pass
-
-        for _, row in joined.iterrows():
-            region = row.get(name_col)
-            if not region or str(region).strip() == "":
-                continue
-            group_id = f"RU_{slugify(region)}"
-            child_id = f"RU_RAY_{row['shapeID']}"
-            if child_id not in groups[group_id]:
-                groups[group_id].append(child_id)
-            if group_id not in labels:
-                labels[group_id] = str(region)
+        joined = join_admin1(centroids, adm1_country, [name_col])
+
+        keep = named_rows(joined[name_col])
+        region = joined[name_col][keep].astype(str)
+        group_ids.append("RU_" + region.map(slugify))
+        child_ids.append("RU_RAY_" + joined["shapeID"][keep].astype(str))
+        label_values.append(region)
 
     try:
         rep_lon_adm1 = representative_longitudes(adm1_country)
@@ -482,75 +554,59 @@ def build_russia_groups_hybrid(adm2_path: Path, adm1_path: Path):
                 adm1_east["adm1_code"] = "RU_" + adm1_east[name_col].astype(str)
             id_col = "adm1_code"
 
-        for _, row in adm1_east.iterrows():
-            region = row.get(name_col)
-            if not region or str(region).strip() == "":
-                continue
-            child_id = str(row.get(id_col, "")).strip()
-            if not child_id:
-                continue
-            group_id = f"RU_{slugify(region)}"
-            if child_id not in groups[group_id]:
-                groups[group_id].append(child_id)
-            if group_id not in labels:
-                labels[group_id] = str(region)
-
-    return groups, labels
+        child = adm1_east[id_col].astype(str).str.strip()
+        keep = named_rows(adm1_east[name_col]) & child.ne("").to_numpy()
+        region = adm1_east[name_col][keep].astype(str)
+        group_ids.append("RU_" + region.map(slugify))
+        child_ids.append(child[keep])
+        label_values.append(region)
+
+    if not group_ids:
+        return {}, {}
+    return group_rows(
+        np.concatenate([ids.to_numpy() for ids in group_ids]),
+        np.concatenate([ids.to_numpy() for ids in child_ids]),
+        np.concatenate([values.to_numpy() for values in label_values]),
+    )
 
 
 def build_poland_groups(powiat_path: Path):
-    gdf = gpd.read_file(powiat_path)
+    gdf = read_vector(powiat_path, columns=["terc"])
     if "terc" not in gdf.columns:
         raise ValueError("Poland powiaty missing terc column.")
 
-    groups = defaultdict(list)
-    labels = {}
-
-    for _, row in gdf.iterrows():
-        terc = str(row.get("terc", ""))
-        if len(terc) < 2:
-            continue
-        voiv_code = terc[:2]
-        voiv_name = POLAND_VOIVODESHIPS.get(voiv_code)
-        if not voiv_name:
-            continue
-        group_id = f"PL_{slugify(voiv_name)}"
-        child_id = f"PL_POW_{terc}"
-        groups[group_id].append(child_id)
-        labels[group_id] = f"{voiv_name} Voivodeship"
+    terc = gdf["terc"].astype(str)
+    voiv_name = terc.str[:2].map(VOIVODESHIP_LOOKUP)
+    keep = (terc.str.len() >= 2) & voiv_name.notna()
+    voiv_name = voiv_name[keep]
 
-    return groups, labels
+    return group_rows(
+        "PL_" + voiv_name.map(slugify),
+        "PL_POW_" + terc[keep],
+        voiv_name + " Voivodeship",
+    )
 
 
-def derive_fr_dept(code):
-    code = str(code)
-    if code.startswith("97") or code.startswith("98"):
-        return code[:3]
-    return code[:2]
+def derive_fr_dept(codes):
+    overseas = codes.str.startswith(("97", "98"))
+    return codes.str[:2].where(~overseas, codes.str[:3])
 
 
 def build_france_groups(arr_path: Path):
-    gdf = gpd.read_file(arr_path)
+    gdf = read_vector(arr_path, columns=["code"])
     if "code" not in gdf.columns:
         raise ValueError("France arrondissements missing code column.")
 
-    groups = defaultdict(list)
-    labels = {}
-
-    for _, row in gdf.iterrows():
-        code = str(row.get("code", ""))
-        if not code:
-            continue
-        dept = derive_fr_dept(code)
-        region = FR_DEPT_TO_REGION.get(dept)
-        if not region:
-            continue
-        group_id = f"FR_{slugify(region)}"
-        child_id = f"FR_ARR_{code}"
-        groups[group_id].append(child_id)
-        labels[group_id] = f"{region} Region"
+    code = gdf["code"].astype(str)
+    region = derive_fr_dept(code).map(FR_REGION_LOOKUP)
+    keep = code.str.len().gt(0) & region.notna()
+    region = region[keep]
 
-    return groups, labels
+    return group_rows(
+        "FR_" + region.map(slugify),
+        "FR_ARR_" + code[keep],
+        region + " Region",
+    )
 
 
 def main():
@@ -579,38 +635,39 @@ def main():
     if not adm1_path:
         raise SystemExit("Could not find ne_10m_admin_1_states_provinces in data/.")
 
-    cn_groups, cn_labels = build_china_groups(adm2_path, adm1_path)
-    ru_groups, ru_labels = build_russia_groups_hybrid(
-        ru_path,
-        adm1_path,
-    )
-    ind_groups, ind_labels = build_india_groups(ind_path, adm1_path=adm1_path)
-    ua_groups, ua_labels = build_admin2_groups(
-        ua_path,
-        adm1_path,
-        "UA",
-        "UA",
-        country_names=["Ukraine"],
-    )
-    pl_groups, pl_labels = build_poland_groups(pl_path)
-    fr_groups, fr_labels = build_france_groups(fr_path)
+    adm1 = ensure_crs(read_vector(adm1_path, columns=ADMIN1_READ_COLS))
+    adm1_by_iso = split_admin1_by_iso(adm1, ["RU", "IN", "UA"])
+
+    # The builders share nothing but the admin1 frame, so run them in
+    # separate processes when more than one core is available.
+    tasks = [
+        (build_china_groups, (adm2_path, adm1)),
+        (build_russia_groups_hybrid, (ru_path, adm1_by_iso["RU"])),
+        (build_india_groups, (ind_path, adm1_by_iso["IN"])),
+        (build_admin2_groups, (ua_path, adm1_by_iso["UA"], "UA", "UA", ["Ukraine"])),
+        (build_poland_groups, (pl_path,)),
+        (build_france_groups, (fr_path,)),
+    ]
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(builder, *args) for builder, args in tasks]
+            results = [future.result() for future in futures]
+    else:
+        results = [builder(*args) for builder, args in tasks]
 
     groups = {}
     labels = {}
-    for source_groups, source_labels in [
-        (cn_groups, cn_labels),
-        (ru_groups, ru_labels),
-        (ind_groups, ind_labels),
-        (ua_groups, ua_labels),
-        (pl_groups, pl_labels),
-        (fr_groups, fr_labels),
-    ]:
+    for source_groups, source_labels in results:
         groups.update(source_groups)
         labels.update(source_labels)
 
     output = {"groups": groups, "labels": labels}
     output_path = DATA_DIR / "hierarchy.json"
-    output_path.write_text(json.dumps(output, indent=2, ensure_ascii=True), encoding="utf-8")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        output_path.write_text(json.dumps(output, indent=2, ensure_ascii=False), encoding="utf-8")
 
     print(f"Wrote {output_path}")
     print(f"Groups: {len(groups)}")
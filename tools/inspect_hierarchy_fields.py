@@ -1,8 +1,13 @@
-﻿import json
-import re
-import sys
+﻿import sys
 from pathlib import Path
 
+try:
+    import pyogrio
+except ImportError as exc:
+    raise SystemExit(
+        "pyogrio is required. Install with: uv pip install pyogrio"
+    ) from exc
+
 DEFAULT_PATHS = [
     'data/china_adm2.geojson',
     'data/france_arrondissements.geojson',
@@ -10,45 +15,37 @@ DEFAULT_PATHS = [
 ]
 
 
-def load_geojson(path: Path):
-    return json.loads(path.read_text(encoding='utf-8'))
-
-
-def summarize_keys(features):
-    keys = set()
-    for feat in features:
-        props = feat.get('properties') or {}
-        keys.update(props.keys())
-    return sorted(keys)
+def read_column(path: Path, column):
+    frame = pyogrio.read_dataframe(path, columns=[column], read_geometry=False)
+    return frame[column].fillna('').astype(str)
 
 
-def print_samples(features, limit=3):
-    for feat in features[:limit]:
-        props = feat.get('properties') or {}
-        sample = {k: props.get(k) for k in list(props.keys())[:10]}
+def print_samples(path: Path, limit=3):
+    frame = pyogrio.read_dataframe(path, max_features=limit, read_geometry=False)
+    for sample in frame.iloc[:, :10].to_dict('records'):
         print(sample)
 
 
-def inspect_china(features, keys):
+def inspect_china(path, keys):
     if 'shapeID' not in keys:
         return
-    ids = [f.get('properties', {}).get('shapeID', '') for f in features]
-    lengths = sorted({len(i) for i in ids if i})
-    hexlike = sum(1 for i in ids if i and re.fullmatch(r'[0-9A-F]+', i))
-    prefix2 = {i[:2] for i in ids if len(i) >= 2}
+    ids = read_column(path, 'shapeID')
+    lengths = sorted(ids[ids != ''].str.len().unique().tolist())
+    hexlike = int(ids.str.fullmatch(r'[0-9A-F]+').sum())
+    prefix2 = set(ids[ids.str.len() >= 2].str[:2])
     print('shapeID lengths:', lengths)
     print('shapeID hexlike:', f"{hexlike}/{len(ids)}")
     print('shapeID prefix2 unique:', len(prefix2), 'sample:', sorted(list(prefix2))[:10])
 
 
-def inspect_france(features, keys):
+def inspect_france(path, keys):
     if 'code' not in keys:
         return
-    codes = [f.get('properties', {}).get('code', '') for f in features]
-    lengths = sorted({len(c) for c in codes if c})
-    non_digit = sorted({c for c in codes if c and not c.isdigit()})
-    prefix2 = {c[:2] for c in codes if len(c) >= 2}
-    prefix3 = {c[:3] for c in codes if len(c) >= 3}
+    codes = read_column(path, 'code')
+    lengths = sorted(codes[codes != ''].str.len().unique().tolist())
+    non_digit = sorted(set(codes[(codes != '') & ~codes.str.isdigit()]))
+    prefix2 = set(codes[codes.str.len() >= 2].str[:2])
+    prefix3 = set(codes[codes.str.len() >= 3].str[:3])
     print('code lengths:', lengths)
     print('code prefix2 unique:', len(prefix2), 'sample:', sorted(list(prefix2))[:10])
     print('code prefix3 unique:', len(prefix3), 'sample:', sorted(list(prefix3))[:10])
@@ -56,13 +53,13 @@ def inspect_france(features, keys):
         print('code non-digit examples:', non_digit)
 
 
-def inspect_poland(features, keys):
+def inspect_poland(path, keys):
     if 'terc' not in keys:
         return
-    terc = [f.get('properties', {}).get('terc', '') for f in features]
-    lengths = sorted({len(t) for t in terc if t})
-    prefix2 = {t[:2] for t in terc if len(t) >= 2}
-    non_digit = [t for t in terc if t and not t.isdigit()]
+    terc = read_column(path, 'terc')
+    lengths = sorted(terc[terc != ''].str.len().unique().tolist())
+    prefix2 = set(terc[terc.str.len() >= 2].str[:2])
+    non_digit = terc[(terc != '') & ~terc.str.isdigit()]
     print('terc lengths:', lengths)
     print('terc prefix2 unique:', len(prefix2), 'sample:', sorted(list(prefix2))[:10])
     print('terc non-digit count:', len(non_digit))
@@ -70,18 +67,17 @@ def inspect_poland(features, keys):
 
 def inspect(path_str):
     path = Path(path_str)
-    data = load_geojson(path)
-    features = data.get('features', [])
-    keys = summarize_keys(features)
-    print(f"{path.name}: features={len(features)}")
+    info = pyogrio.read_info(path, force_feature_count=True)
+    keys = sorted(info['fields'])
+    print(f"{path.name}: features={info['features']}")
     print('keys:', keys)
-    print_samples(features)
+    print_samples(path)
     if 'china' in path.name:
-        inspect_china(features, keys)
+        inspect_china(path, keys)
     if 'france' in path.name:
-        inspect_france(features, keys)
+        inspect_france(path, keys)
     if 'poland' in path.name:
-        inspect_poland(features, keys)
+        inspect_poland(path, keys)
     print('---')
 
 
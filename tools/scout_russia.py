@@ -46,6 +46,8 @@ CANDIDATE_TYPE_COLS = [
     "type",
 ]
 
+LFS_POINTER_PREFIX = b"version https://git-lfs.github.com/spec/v1"
+
 
 def download(urls, dest: Path):
     if dest.exists() and dest.stat().st_size > 0:
@@ -79,10 +81,10 @@ def download(urls, dest: Path):
 
 def is_lfs_pointer(path: Path) -> bool:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            first_line = handle.readline().strip()
-        return first_line.startswith("version https://git-lfs.github.com/spec/v1")
-    except Exception:
+        with path.open("rb") as handle:
+            head = handle.read(len(LFS_POINTER_PREFIX))
+        return head == LFS_POINTER_PREFIX
+    except OSError:
         return False
 
 
@@ -129,7 +131,10 @@ def summarize_types(gdf):
 
 def inspect_dataset(label, path: Path):
     print(f"\n== {label} ==")
-    gdf = gpd.read_file(path)
+    try:
+        gdf = gpd.read_file(path, engine="pyogrio", use_arrow=True)
+    except ImportError:
+        gdf = gpd.read_file(path)
     print(f"Rows: {len(gdf)}")
     print("Columns:", list(gdf.columns))
     try:
@@ -1,6 +1,20 @@
+import hashlib
 import json
+import mmap
+import os
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 try:
     # Attempt absolute import (for when running from root via init_map_data.py)
     from tools.geo_seeds import EUROPE_GEO_SEEDS
@@ -42,34 +56,92 @@ MANUAL_UI_DICT = {
     "Opacity": "不透明度",
     "Format": "格式",
 }
+MANUAL_UI_DICT = {sys.intern(key): value for key, value in MANUAL_UI_DICT.items()}
+MANUAL_UI_KEYS = frozenset(MANUAL_UI_DICT)
+
+
+def load_json_bytes(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json_mapped(path: Path):
+    # orjson parses straight from the page cache without copying the file
+    # into a bytes object first; the stdlib fallback still needs a copy.
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Empty JSON file: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if orjson is not None:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return json.loads(mapped[:])
+
+
+def dump_json_bytes(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def stream_properties(path: Path, prefix: str):
+    with path.open("rb") as f:
+        for props in ijson.items(f, prefix):
+            yield props or {}
+
+
+def read_geo_properties(topo_path: Path):
+    # ijson only materializes the property dicts; arcs and coordinates are
+    # skipped by the parser instead of being built and thrown away.
+    if ijson is not None:
+        with topo_path.open("rb") as f:
+            is_topology = next(ijson.items(f, "type"), None) == "Topology"
+        if is_topology:
+            prefix = "objects.political.geometries.item.properties"
+        else:
+            prefix = "features.item.properties"
+        return is_topology, stream_properties(topo_path, prefix)
+
+    data = load_json_bytes(topo_path.read_bytes())
+    if isinstance(data, dict) and data.get("type") == "Topology":
+        political = data.get("objects", {}).get("political")
+        geometries = political.get("geometries", []) if isinstance(political, dict) else []
+        return True, ((geom.get("properties") or {}) for geom in geometries)
+    if isinstance(data, dict) and "features" in data:
+        features = data.get("features", [])
+        return False, ((feat.get("properties") or {}) for feat in features)
+    return False, iter(())
+
+
+def write_atomic(path: Path, data: bytes):
+    # A crash mid-write leaves the previous file intact instead of a
+    # truncated one.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
 
 def load_geo_names(topo_path: Path):
     if not topo_path.exists():
         raise FileNotFoundError(f"Missing topology file: {topo_path}")
 
-    with topo_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    is_topology, properties = read_geo_properties(topo_path)
 
     names = set()
-    if isinstance(data, dict) and data.get("type") == "Topology":
-        political = data.get("objects", {}).get("political")
-        if political and isinstance(political, dict):
-            for geom in political.get("geometries", []):
-                props = geom.get("properties") or {}
-                name = props.get("name")
-                if isinstance(name, str) and name.strip():
-                    names.add(name.strip())
-                else:
-                    for key, value in props.items():
-                        if "name" in key.lower() and isinstance(value, str) and value.strip():
-                            names.add(value.strip())
-    elif isinstance(data, dict) and "features" in data:
-        for feat in data.get("features", []):
-            props = feat.get("properties") or {}
-            for key, value in props.items():
-                if "name" in key.lower() and isinstance(value, str) and value.strip():
-                    names.add(value.strip())
+    # Property keys repeat across every feature; lowercase each one once.
+    name_key_cache = {}
+    for props in properties:
+        name = props.get("name") if is_topology else None
+        if isinstance(name, str) and name.strip():
+            names.add(sys.intern(name.strip()))
+            continue
+        for key, value in props.items():
+            is_name = name_key_cache.get(key)
+            if is_name is None:
+                is_name = name_key_cache[key] = "name" in key.lower()
+            if is_name and isinstance(value, str) and value.strip():
+                names.add(sys.intern(value.strip()))
 
     return sorted(names)
 
@@ -78,8 +150,7 @@ def load_existing_locales(path: Path):
     if not path.exists():
         return {"ui": {}, "geo": {}}
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_mapped(path)
         ui = data.get("ui") if isinstance(data, dict) else {}
         geo = data.get("geo") if isinstance(data, dict) else {}
         return {"ui": ui or {}, "geo": geo or {}}
@@ -88,50 +159,76 @@ def load_existing_locales(path: Path):
 
 
 def merge_ui(existing_ui):
-    keys = set(existing_ui.keys()) | set(MANUAL_UI_DICT.keys())
     merged = {}
-    for key in sorted(keys):
-        if key in MANUAL_UI_DICT:
-            zh = MANUAL_UI_DICT[key]
+    for key in existing_ui.keys() | MANUAL_UI_KEYS:
+        try:
+            entry = existing_ui[key]
+        except KeyError:
+            en = zh_prev = key
         else:
-            zh = existing_ui.get(key, {}).get("zh", key)
-        en = existing_ui.get(key, {}).get("en", key)
-        merged[key] = {"en": en, "zh": zh}
+            en = entry.get("en", key)
+            zh_prev = entry.get("zh", key)
+        merged[key] = {"en": en, "zh": MANUAL_UI_DICT.get(key, zh_prev)}
     return merged
 
 
-def normalize_existing_geo(existing_geo):
-    normalized = {}
-    for key, value in existing_geo.items():
-        if isinstance(value, dict):
-            en = value.get("en", key)
-            zh = value.get("zh", key)
-        else:
-            en = key
-            zh = str(value)
-        normalized[key] = {"en": en, "zh": zh}
-    return normalized
+def normalize_geo_entry(key, value):
+    if isinstance(value, dict):
+        get = value.get
+        return {"en": get("en", key), "zh": get("zh", key)}
+    return {"en": key, "zh": str(value)}
 
 
 def merge_geo(geo_names, existing_geo):
-    merged = normalize_existing_geo(existing_geo)
-
-    for name in geo_names:
-        if name in merged:
-            continue
-        if name in EUROPE_GEO_SEEDS:
-            zh = EUROPE_GEO_SEEDS[name]
+    # Existing entries win; new names fall back to the seeds, then a TODO.
+    # Key order is fixed up once in main when the payload is assembled.
+    merged = {}
+    for name in existing_geo.keys() | set(geo_names):
+        # Interned so the key and its "en" value share one string object.
+        name = sys.intern(name)
+        if name in existing_geo:
+            merged[name] = normalize_geo_entry(name, existing_geo[name])
         else:
-            zh = f"[TODO] {name}"
-        merged[name] = {"en": name, "zh": zh}
+            zh = EUROPE_GEO_SEEDS.get(name)
+            if zh is None:
+                zh = f"[TODO] {name}"
+            merged[name] = {"en": name, "zh": zh}
+    return merged
+
 
-    return {k: merged[k] for k in sorted(merged.keys())}
+def seed_fingerprint():
+    seeds = [sorted(MANUAL_UI_DICT.items()), sorted(EUROPE_GEO_SEEDS.items())]
+    return hashlib.sha1(dump_json_bytes(seeds)).hexdigest()
+
+
+def read_sync_meta(meta_path: Path):
+    try:
+        return load_json_bytes(meta_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def sync_state(topo_path: Path, output_path: Path, seeds: str):
+    return {
+        "topology_mtime_ns": topo_path.stat().st_mtime_ns,
+        "locales_mtime_ns": output_path.stat().st_mtime_ns,
+        "seeds": seeds,
+    }
 
 
 def main():
     base_dir = Path(__file__).resolve().parents[1]
     topo_path = base_dir / "data" / "europe_topology.json"
     output_path = base_dir / "data" / "locales.json"
+    meta_path = output_path.with_suffix(".meta.json")
+
+    # Nothing to redo when neither the topology, the seed dictionaries nor
+    # the last written locales.json changed since the previous sync.
+    seeds = seed_fingerprint()
+    if topo_path.exists() and output_path.exists():
+        if read_sync_meta(meta_path) == sync_state(topo_path, output_path, seeds):
+            print(f"OK: {output_path.name} is up to date; skipping sync.")
+            return
 
     geo_names = load_geo_names(topo_path)
     existing = load_existing_locales(output_path)
@@ -139,11 +236,15 @@ def main():
     ui_payload = merge_ui(existing.get("ui", {}))
     geo_payload = merge_geo(geo_names, existing.get("geo", {}))
 
-    payload = {"ui": ui_payload, "geo": geo_payload}
+    # Sort the entries but keep the top-level ui/geo order of the tracked file.
+    payload = {
+        "ui": dict(sorted(ui_payload.items())),
+        "geo": dict(sorted(geo_payload.items())),
+    }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    write_atomic(output_path, dump_json_bytes(payload))
+    write_atomic(meta_path, dump_json_bytes(sync_state(topo_path, output_path, seeds)))
 
     print(f"OK: Extracted {len(geo_names)} geographical names and {len(ui_payload)} UI labels.")
     print(f"Saved locales to: {output_path}")